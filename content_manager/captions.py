@@ -1,6 +1,7 @@
 import csv
+import io
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set, TextIO, Tuple, Union
 
 from config.logging import logger
 
@@ -16,16 +17,34 @@ class CaptionsValidator(StrictValidator):
         self.content_types: Set[str] = set()
         self.products: Dict[str, Set[str]] = {}
         self.validation_messages: List[Tuple[str, str]] = []
+        self._text = None  # Captions content, read once per validate()
+
+    def reset(self):
+        """Clear messages and results so the validator can be reused"""
+        self.clear_messages()
+        self.separator = ","
+        self.content_types = set()
+        self.products = {}
+        self.validation_messages = []
+        self._text = None
 
     def validate(
-        self, file_path: Path, separator: str = ","
+        self, file_path: Union[Path, TextIO], separator: str = ","
     ) -> Tuple[Set[str], Dict[str, Set[str]]]:
-        """Main validation method"""
+        """Main validation method
+
+        Args:
+            file_path: Path to captions.csv, or an already open text stream
+            separator: CSV separator character
+        """
         self.separator = separator
         self.clear_messages()
 
-        # Basic file checks first
-        if not self._validate_file_basics(file_path):
+        if hasattr(file_path, "read"):
+            # File-like source: file level checks don't apply
+            self._text = file_path.read()
+        elif not self._validate_file_basics(file_path):
+            # Basic file checks first
             self.raise_if_errors()
             return set(), {}
 
@@ -70,6 +89,14 @@ class CaptionsValidator(StrictValidator):
 
         return self.content_types, self.products
 
+    def _open_source(self) -> TextIO:
+        """Open the captions text that validate() read for another pass
+
+        Every check re-reads the whole CSV, so they share the text read once
+        up front instead of reopening the file.
+        """
+        return io.StringIO(self._text)
+
     def _validate_file_basics(self, file_path: Path) -> bool:
         """Validate basic file requirements
 
@@ -97,15 +124,21 @@ class CaptionsValidator(StrictValidator):
             logger.critical(f"Validation failed: File is empty at {file_path}")
             return False
 
-        # Check UTF-8 encoding
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                f.read()
-        except UnicodeDecodeError:
-            self.add_error(f"File is not UTF-8 encoded: {file_path}")
-            logger.debug(f"Validation failed: File is not UTF-8 encoded at {file_path}")
-            return False
+        # Check UTF-8 encoding. Most captions are plain ASCII, which is valid
+        # UTF-8 and decodes without the general validation.
+        raw = file_path.read_bytes()
+        if raw.isascii():
+            text = raw.decode("ascii")
+        else:
+            try:
+                text = raw.decode("utf-8")
+            except UnicodeDecodeError:
+                self.add_error(f"File is not UTF-8 encoded: {file_path}")
+                logger.debug(f"Validation failed: File is not UTF-8 encoded at {file_path}")
+                return False
 
+        # Same newline handling as opening the file in text mode
+        self._text = text.replace("\r\n", "\n").replace("\r", "\n")
         return True
 
     def _validate_headers(self, file_path: Path) -> bool:
@@ -115,7 +148,7 @@ class CaptionsValidator(StrictValidator):
 
         # 1. Read header line
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)  # Get first line as list
 
@@ -200,7 +233,7 @@ class CaptionsValidator(StrictValidator):
     def _check_empty_rows(self, file_path: Path) -> bool:
         """Check ONLY for completely empty unquoted rows"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 next(f)  # Skip header
                 for row_num, line in enumerate(f, start=2):
                     stripped = line.strip()
@@ -228,7 +261,7 @@ class CaptionsValidator(StrictValidator):
 
     def _check_column_count(self, file_path: Path) -> bool:
         """Check ONLY column counts"""
-        with open(file_path, "r", encoding="utf-8") as f:
+        with self._open_source() as f:
             reader = csv.reader(f, delimiter=self.separator)
             headers = next(reader)
             expected_columns = len(headers)
@@ -242,7 +275,7 @@ class CaptionsValidator(StrictValidator):
     def _check_string_cells(self, file_path: Path) -> bool:
         """Check ONLY that all cells are strings and look like strings"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 next(reader)  # Skip headers
 
@@ -268,7 +301,7 @@ class CaptionsValidator(StrictValidator):
     def _check_whitespace_cells(self, file_path: Path) -> bool:
         """Check ONLY that cells are not unquoted whitespace-only"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 next(reader)  # Skip headers
 
@@ -302,7 +335,7 @@ class CaptionsValidator(StrictValidator):
     def _check_empty_cell_quotes(self, file_path: Path) -> bool:
         """Check ONLY that empty cells use explicit quotes ("")"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 content = f.read()
                 lines = content.splitlines()
                 headers = lines[0].split(self.separator)
@@ -335,7 +368,7 @@ class CaptionsValidator(StrictValidator):
     def _populate_products(self, file_path: Path) -> bool:
         """Populate content types and products dictionary"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)
 
@@ -375,7 +408,7 @@ class CaptionsValidator(StrictValidator):
     def _check_product_cells(self, file_path: Path) -> bool:
         """Check ONLY product cells for validity"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)
 
@@ -418,7 +451,7 @@ class CaptionsValidator(StrictValidator):
     def _check_empty_content_format(self, file_path: Path) -> bool:
         """Check ONLY that empty content cells use explicit quotes (\"\")"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 lines = f.readlines()
                 headers = lines[0].strip().split(self.separator)
 
@@ -454,7 +487,7 @@ class CaptionsValidator(StrictValidator):
     def _check_product_name_not_content_type(self, file_path: Path) -> bool:
         """Check ONLY that product names don't match content types"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)
 
@@ -490,7 +523,7 @@ class CaptionsValidator(StrictValidator):
     def _check_reserved_product_names(self, file_path: Path) -> bool:
         """Check ONLY that product names are not 'none' (case insensitive)"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)
 
@@ -523,7 +556,7 @@ class CaptionsValidator(StrictValidator):
     def _check_unique_product_names(self, file_path: Path) -> bool:
         """Check ONLY that product names don't have case variations within their type"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with self._open_source() as f:
                 reader = csv.reader(f, delimiter=self.separator)
                 headers = next(reader)
 
@@ -578,7 +611,7 @@ class CaptionsValidator(StrictValidator):
     def _check_unquoted_empty_rows(self, file_path: Path) -> bool:
         """Check ONLY for rows that are just commas with no quotes (,,,)"""
         try:
-            with open(file_path, "r") as f:
+            with self._open_source() as f:
                 next(f)  # Skip header
                 for row_num, line in enumerate(f, start=2):
                     stripped_line = line.strip()
@@ -743,27 +776,29 @@ class CaptionsHelper:
             for content_type in content_types
         }
 
+        # Resolve the product/content column pairs and valid product names
+        # once, instead of rescanning the headers for every row
+        columns = []
+        for content_type in content_types:
+            product_indices = [i for i, h in enumerate(headers) if h == f"product_{content_type}"]
+            content_indices = [i for i, h in enumerate(headers) if h == content_type]
+            columns.append((
+                by_type[content_type],
+                set(products[content_type]),
+                list(zip(product_indices, content_indices)),
+            ))
+
         # Process each row
         for row in rows:
-            # For each content type
-            for content_type in content_types:
-                try:
-                    # Find all occurrences of product/content pairs for this type
-                    product_indices = [i for i, h in enumerate(headers) if h == f"product_{content_type}"]
-                    content_indices = [i for i, h in enumerate(headers) if h == content_type]
-                    
-                    # Process each pair of indices
-                    for product_idx, content_idx in zip(product_indices, content_indices):
-                        if product_idx < len(row) and content_idx < len(row):
-                            product = row[product_idx].strip()
-                            content = row[content_idx].strip()
-                            
-                            if product and content:  # Only add if both exist
-                                if product in products[content_type]:
-                                    if product not in by_type[content_type]:
-                                        by_type[content_type][product] = []
-                                    by_type[content_type][product].append(content)
-                except (ValueError, IndexError):
-                    continue
+            row_len = len(row)
+            for captions_by_product, valid_products, index_pairs in columns:
+                # Process each pair of indices
+                for product_idx, content_idx in index_pairs:
+                    if product_idx < row_len and content_idx < row_len:
+                        product = row[product_idx].strip()
+                        content = row[content_idx].strip()
 
-        return {"headers": headers, "captions": rows, "by_type": by_type}
\ No newline at end of file
+                        if product and content and product in valid_products:
+                            captions_by_product[product].append(content)
+
+        return {"headers": headers, "captions": rows, "by_type": by_type}
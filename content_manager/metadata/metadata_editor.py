@@ -12,6 +12,11 @@ class MetadataEditor:
 
     def __init__(self, metadata: Dict):
         self.metadata = metadata
+        # Bumped on every edit so callers can cache data derived from metadata
+        self.version = 0
+        # content type -> product name -> product entry, built on first use
+        self._product_index: Dict[str, Dict[str, Dict]] = {}
+        self._product_index_source = None
 
     # Content Types
     def get_content_types(self, filter: Optional[str] = None) -> List[str]:
@@ -82,6 +87,7 @@ class MetadataEditor:
 
         # Update image data
         image.update(data)
+        self.version += 1
 
     # Untagged
     def get_untagged(self) -> List[str]:
@@ -91,6 +97,7 @@ class MetadataEditor:
     def edit_untagged(self, untagged: List[str]) -> None:
         """Update untagged list"""
         self.metadata["untagged"] = untagged
+        self.version += 1
 
     # Settings
     def get_settings(
@@ -304,6 +311,8 @@ class MetadataEditor:
             # - Clear cached values if any
             # - Log changes if needed
 
+        self.version += 1
+
     def move_untagged_image(self, image_name: str, target_content_type: str) -> None:
         """Move image from untagged to a content type folder."""
         logger.debug(
@@ -370,6 +379,7 @@ class MetadataEditor:
             # Remove from untagged and sort
             self.metadata["untagged"].remove(image_name)
             self.metadata["untagged"].sort()
+            self.version += 1
             logger.debug(f"✓ Removed from untagged list and sorted")
 
             # Save changes to disk
@@ -419,6 +429,7 @@ class MetadataEditor:
 
         # 3. Update product
         self.metadata["images"][image_name]["product"] = new_product
+        self.version += 1
 
     def _update_product_count(self, content_type: str, product: str, increment: bool):
         """Update the current count for a product.
@@ -428,11 +439,22 @@ class MetadataEditor:
             product: Product name to update
             increment: True to increase count, False to decrease
         """
-        for prod in self.metadata["products"][content_type]:
-            if prod["name"] == product:
-                if "current_count" not in prod:
-                    prod["current_count"] = 0
-                prod["current_count"] += 1 if increment else -1
-                break
+        prod = self._products_by_name(content_type).get(product)
+        if prod is not None:
+            if "current_count" not in prod:
+                prod["current_count"] = 0
+            prod["current_count"] += 1 if increment else -1
 
+    def _products_by_name(self, content_type: str) -> Dict[str, Dict]:
+        """Get a content type's product entries keyed by name
 
+        The index holds the same dicts as metadata["products"] and is rebuilt
+        if the products section is replaced.
+        """
+        products = self.metadata["products"]
+        if self._product_index_source is not products:
+            self._product_index = {
+                ct: {p["name"]: p for p in plist} for ct, plist in products.items()
+            }
+            self._product_index_source = products
+        return self._product_index[content_type]
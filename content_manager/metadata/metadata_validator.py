@@ -1,12 +1,43 @@
+import functools
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
+from itertools import islice
 
 from content_manager.settings.settings_validator import SettingsValidator
 from content_manager.captions import CaptionsHelper
 from config.logging import logger
 
 
+# Valid image settings_source values
+_VALID_SOURCES = frozenset({"default", "custom", "product", "content"})
+
+
+def _read_image_size(path) -> Tuple[int, int]:
+    """Open an image and return its (width, height)"""
+    from PIL import Image  # type: ignore
+
+    with Image.open(path) as img:
+        return img.size
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_image_size(path_str: str, mtime_ns: int, size: int) -> Tuple[int, int]:
+    """Read an image's size once per (path, mtime, size) version of the file"""
+    return _read_image_size(path_str)
+
+
+def _image_size(img_path: Path) -> Tuple[int, int]:
+    """Actual (width, height) of an image, cached while the file is unchanged"""
+    try:
+        stat = os.stat(img_path)
+    except OSError:
+        # Can't key the cache; let the uncached read report the problem
+        return _read_image_size(img_path)
+    return _cached_image_size(str(img_path), stat.st_mtime_ns, stat.st_size)
+
+
 class MetadataValidator:
     # Define expected structure and order
     REQUIRED_KEYS_ORDER = [
@@ -18,20 +49,38 @@ class MetadataValidator:
         "settings",
     ]
 
+    # Fixed per-instance attributes, set in __init__
+    __slots__ = (
+        "strict",
+        "errors",
+        "warnings",
+        "seen_warnings",
+        "settings_validator",
+        "base_path",
+        "_validated_settings",
+    )
+
     def __init__(self, base_path: Path, strict: bool = True):
         self.strict = strict
         self.errors = []
         self.warnings = []
+        self.seen_warnings: Set[str] = set()  # keys gating add_warning
         self.settings_validator = SettingsValidator()
         self.base_path = base_path
+        self._validated_settings: Dict[int, Dict] = {}  # id -> settings block that passed
+
+    def reset(self) -> None:
+        """Clear the errors, warnings and caches left by a previous run"""
+        self.errors.clear()
+        self.warnings.clear()
+        self.seen_warnings.clear()
+        self._validated_settings = {}
 
     def validate(
         self, data: Dict, content_types: List[str], products: Dict[str, List[Dict]]
     ) -> bool:
         """Validate metadata structure and content."""
-        self.errors.clear()
-        self.warnings.clear()
-        self.seen_warnings = set()
+        self.reset()
 
         # Check keys order - this is a hard requirement
         if list(data.keys()) != self.REQUIRED_KEYS_ORDER:
@@ -164,28 +213,43 @@ class MetadataValidator:
         # After validating basic structure, check image counts for products
         images = data.get("images", {})
 
+        # Products with a minimum image count to check. When there are none,
+        # e.g. every product list is empty, images are not counted at all.
+        min_required = [
+            (ct, prod)
+            for ct, prods in products.items()
+            for prod in prods
+            if prod["prevent_duplicates"] and prod["min_occurrences"] > 0
+        ]
+
         # Count product usage in images AND collect missing product warnings
         product_counts = {ct: {} for ct in products.keys()}
+        # Valid products per content type for the warnings, built on first use
+        valid_products_by_ct: Dict[str, List[str]] = {}
 
         for img_name, img_data in images.items():
             ct = img_data["content_type"]
             prod = img_data["product"]
             if prod:  # Only count if product is assigned
-                product_counts[ct][prod] = product_counts[ct].get(prod, 0) + 1
+                if min_required:
+                    product_counts[ct][prod] = product_counts[ct].get(prod, 0) + 1
             else:
-                # Get valid products for this content type
-                valid_products = [p["name"] for p in data["products"][ct]]
-                # Create warning with valid products list
-                # all is always a valid product, but it doesn't have to exist in the captions. 
-                
-                # Reorder products: 'all' first, then rest alphabetically
-                if "all" in valid_products:
-                    valid_products.remove("all")
-                    valid_products.sort()  # Sort remaining products
-                    valid_products.insert(0, "all")  # Put 'all' back at start
-                else:
-                    valid_products.sort()  # Just sort if no 'all'
-                
+                valid_products = valid_products_by_ct.get(ct)
+                if valid_products is None:
+                    # Get valid products for this content type
+                    valid_products = [p["name"] for p in data["products"][ct]]
+                    # Create warning with valid products list
+                    # all is always a valid product, but it doesn't have to exist in the captions. 
+
+                    # Reorder products: 'all' first, then rest alphabetically
+                    if "all" in valid_products:
+                        valid_products.remove("all")
+                        valid_products.sort()  # Sort remaining products
+                        valid_products.insert(0, "all")  # Put 'all' back at start
+                    else:
+                        valid_products.sort()  # Just sort if no 'all'
+                    valid_products_by_ct[ct] = valid_products
+
                 # Create warning with properly ordered products list
                 warning_key = f"missing_product_{img_name}"
                 msg = f"Image {img_name} has no product assigned. Valid products: {valid_products}"
@@ -196,20 +260,18 @@ class MetadataValidator:
                     self.add_warning(msg, warning_key)
 
         # Check counts against min_occurrences for products with prevent_duplicates
-        for ct, prods in products.items():
-            for prod in prods:
-                if prod["prevent_duplicates"] and prod["min_occurrences"] > 0:
-                    count = product_counts[ct].get(prod["name"], 0)
-                    if count < prod["min_occurrences"]:
-                        msg = (
-                            f"Product '{prod['name']}' in {ct} requires at least "
-                            f"{prod['min_occurrences']} images (has {count})"
-                        )
-                        if self.strict:
-                            self.errors.append(msg)
-                            return False
-                        else:
-                            self.add_warning(msg)
+        for ct, prod in min_required:
+            count = product_counts[ct].get(prod["name"], 0)
+            if count < prod["min_occurrences"]:
+                msg = (
+                    f"Product '{prod['name']}' in {ct} requires at least "
+                    f"{prod['min_occurrences']} images (has {count})"
+                )
+                if self.strict:
+                    self.errors.append(msg)
+                    return False
+                else:
+                    self.add_warning(msg)
 
         return True
 
@@ -247,13 +309,25 @@ class MetadataValidator:
         """Validate images section with comprehensive checks."""
         images = data.get("images", {})
 
-        # Validate images are sorted alphabetically
-        image_names = list(images.keys())
-        if image_names != sorted(image_names):
+        # Product names per content type in metadata order, plus a set of
+        # them for membership checks, built on first use
+        product_names: Dict[str, List[str]] = {}
+        product_name_sets: Dict[str, Set[str]] = {}
+
+        def names_for(ct: str) -> List[str]:
+            if ct not in product_names:
+                product_names[ct] = [p["name"] for p in data["products"][ct]]
+                product_name_sets[ct] = set(product_names[ct])
+            return product_names[ct]
+
+        # Validate images are sorted alphabetically, stopping at the first
+        # out of order pair
+        if not all(a <= b for a, b in zip(images, islice(images, 1, None))):
             self.errors.append("Images must be sorted alphabetically")
             return False
 
-        for img_name, img_data in sorted(images.items()):
+        # Already in name order, so no need to sort the items
+        for img_name, img_data in images.items():
             # 1. Basic field validation
             required_fields = [
                 "content_type",
@@ -298,20 +372,17 @@ class MetadataValidator:
             img_path = Path(data["structure"][content_type]["path"]) / img_name
             if img_path.exists():
                 try:
-                    from PIL import Image # type: ignore
-
-                    with Image.open(img_path) as img:
-                        actual_width, actual_height = img.size
-                        if (
-                            actual_width != dimensions["width"]
-                            or actual_height != dimensions["height"]
-                        ):
-                            self.errors.append(
-                                f"Image {img_name} dimensions mismatch: "
-                                f"stored: {dimensions['width']}x{dimensions['height']}, "
-                                f"actual: {actual_width}x{actual_height}"
-                            )
-                            return False
+                    actual_width, actual_height = _image_size(img_path)
+                    if (
+                        actual_width != dimensions["width"]
+                        or actual_height != dimensions["height"]
+                    ):
+                        self.errors.append(
+                            f"Image {img_name} dimensions mismatch: "
+                            f"stored: {dimensions['width']}x{dimensions['height']}, "
+                            f"actual: {actual_width}x{actual_height}"
+                        )
+                        return False
                 except Exception as e:
                     self.errors.append(
                         f"Failed to verify dimensions for {img_name}: {str(e)}"
@@ -322,9 +393,7 @@ class MetadataValidator:
             settings_source = img_data["settings_source"]
             settings = img_data["settings"]
 
-            # Define valid settings sources
-            valid_sources = ["default", "custom", "product", "content"]
-            if settings_source not in valid_sources:
+            if settings_source not in _VALID_SOURCES:
                 msg = f"Image {img_name} has invalid settings_source: {settings_source}"
                 if self.strict:
                     self.errors.append(msg)
@@ -363,7 +432,7 @@ class MetadataValidator:
                         )
                 else:
                     # Validate content settings
-                    if not self.settings_validator.validate_settings(content_settings):
+                    if not self._validate_settings_block(content_settings):
                         self.errors.extend(
                             [
                                 f"Image {img_name} content settings: {e}"
@@ -396,7 +465,7 @@ class MetadataValidator:
                         )
                 else:
                     # Validate product settings
-                    if not self.settings_validator.validate_settings(product_settings):
+                    if not self._validate_settings_block(product_settings):
                         self.errors.extend(
                             [
                                 f"Image {img_name} product settings: {e}"
@@ -413,7 +482,7 @@ class MetadataValidator:
 
             # 5. Product validation
             if img_data["product"] is None:
-                valid_products = [p["name"] for p in data["products"][content_type]]
+                valid_products = names_for(content_type)
                 # Create a unique warning key for this specific image
                 warning_key = f"missing_product_{img_name}"
                 msg = f"Image {img_name} has no product assigned. Valid products: ['all', {valid_products}]"
@@ -427,8 +496,8 @@ class MetadataValidator:
                 if img_data["product"] == "all":
                     continue
                     
-                valid_products = [p["name"] for p in data["products"][content_type]]
-                if img_data["product"] not in valid_products:
+                valid_products = names_for(content_type)
+                if img_data["product"] not in product_name_sets[content_type]:
                     self.errors.append(
                         f"Image {img_name} has invalid product: {img_data['product']}. "
                         f"Valid products: {sorted(['all'] + valid_products)}"
@@ -510,7 +579,7 @@ class MetadataValidator:
 
             # 3. Validate content settings if they exist
             if ct_settings["content"] is not None:
-                if not self.settings_validator.validate_settings(
+                if not self._validate_settings_block(
                     ct_settings["content"]
                 ):
                     self.errors.extend(
@@ -556,7 +625,7 @@ class MetadataValidator:
 
                 # Validate settings if they exist
                 if value is not None:
-                    if not self.settings_validator.validate_settings(value):
+                    if not self._validate_settings_block(value):
                         self.errors.extend(
                             [
                                 f"{content_type} {key} settings: {e}"
@@ -571,36 +640,25 @@ class MetadataValidator:
         """Validate product counts and coverage"""
         logger.debug("Validating product counts and image coverage...")
         
-        product_counts = {}
-        
-        # Initialize count structure
-        for ct in data["products"]:
-            product_counts[ct] = defaultdict(int)
-
-        # First pass: Count non-'all' images
-        for img_name, img_data in data["images"].items():
-            ct = img_data.get("content_type")
-            prod = img_data.get("product")
-            
-            if prod and prod != "all":
-                product_counts[ct][prod] += 1
-        
-        # Second pass: Add 'all' images to total count
-        all_images_count = {}
-        for ct in data["products"]:
-            all_images_count[ct] = sum(1 for img in data["images"].values() 
-                                    if img.get("content_type") == ct and img.get("product") == "all")
+        # Single pass: count images per (content type, product), 'all' included
+        image_counts = Counter(
+            (img_data.get("content_type"), img_data.get("product"))
+            for img_data in data["images"].values()
+        )
 
         # Validate counts against metadata
         for content_type, products in data["products"].items():
+            all_images_count = image_counts[(content_type, "all")]
             for product_info in products:
                 product_name = product_info["name"]
                 stored_count = product_info.get("current_count", 0)
                 
                 # Get product-specific count
-                actual_count = product_counts[content_type][product_name]
+                actual_count = 0
+                if product_name != "all":
+                    actual_count = image_counts[(content_type, product_name)]
                 # Add 'all' images count only once
-                actual_count += all_images_count[content_type]
+                actual_count += all_images_count
                 
                 # Update the stored count
                 product_info["current_count"] = actual_count
@@ -612,6 +670,22 @@ class MetadataValidator:
                 logger.debug(f"Product count validation for {content_type}/{product_name}: metadata={stored_count}, actual={actual_count}")
         
         return True
+
+    def _validate_settings_block(self, settings: Dict) -> bool:
+        """Validate a settings block once per validate() run
+
+        Images point at their content type's or product group's settings, so
+        the same block would otherwise be re-checked (font files included)
+        for every image using it. Blocks are kept referenced so their ids
+        stay unique.
+        """
+        if self._validated_settings.get(id(settings)) is settings:
+            return True
+        if not self.settings_validator.validate_settings(settings):
+            return False
+        self._validated_settings[id(settings)] = settings
+        return True
+
     def add_warning(self, msg: str, key: Optional[str] = None):
         """Add warning only if not seen before.
         
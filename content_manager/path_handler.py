@@ -127,7 +127,7 @@ class PathValidator(StrictValidator):
         try:
             allowed = {name.lower() for name in self.content_types} | {"metadata"}
 
-            for item in base_path.iterdir():
+            for item in self._scan_dir(base_path):
                 if item.name.startswith("."):
                     continue
 
@@ -135,8 +135,8 @@ class PathValidator(StrictValidator):
                     # Special handling for preview folder
                     if item.name.lower() == "preview":
                         import shutil
-                        logger.warning(f"Found a preview folder, deleting it: {item}")
-                        shutil.rmtree(item)
+                        logger.warning(f"Found a preview folder, deleting it: {item.path}")
+                        shutil.rmtree(item.path)
                         continue
                         
                     msg = f"Unexpected folder(s) found: {item.name}"
@@ -179,10 +179,10 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue  # Skip non-existent folders - handled by exists check
 
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if item.name.startswith("."):
                         continue
-                    if not item.is_file() or not self._is_valid_image(item):
+                    if not item.is_file() or not self._is_valid_image(Path(item.path)):
                         msg = f"Invalid file in {content_type} folder: {item.name}"
                         self.add_error(msg)
                         raise ValueError(msg)
@@ -193,6 +193,16 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error checking folder contents: {str(e)}")
             return False
 
+    @staticmethod
+    def _scan_dir(path: Path) -> List[os.DirEntry]:
+        """List a directory with os.scandir.
+
+        DirEntry.is_file/is_dir answer from the directory listing itself, so the
+        checks below don't stat every entry the way Path.iterdir() does.
+        """
+        with os.scandir(path) as entries:
+            return list(entries)
+
     def _is_valid_image(self, file_path: Path) -> bool:
         """Helper to check if file is a valid image"""
         try:
@@ -250,7 +260,7 @@ class PathValidator(StrictValidator):
     def _check_folder_names_exact_match(self, base_path: Path) -> bool:
         """Check ONLY if folder names match content types exactly"""
         try:
-            for item in base_path.iterdir():
+            for item in self._scan_dir(base_path):
                 if item.name.startswith("."):
                     continue
 
@@ -279,7 +289,7 @@ class PathValidator(StrictValidator):
 
                 # Check if folder has any non-hidden files
                 has_files = False
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if not item.name.startswith(".") and item.is_file():
                         has_files = True
                         break
@@ -331,14 +341,14 @@ class PathValidator(StrictValidator):
         try:
             allowed_files = {"captions.csv", "metadata.json"}
 
-            for item in base_path.iterdir():
+            for item in self._scan_dir(base_path):
                 if item.name.startswith("."):
                     continue
 
                 if item.is_file():
                     if item.name not in allowed_files:
                         # Check if it's an image
-                        if self._is_valid_image(item):
+                        if self._is_valid_image(Path(item.path)):
                             msg = f"Image found in base folder: {item.name}. Consider moving to appropriate content folder."
                             self.add_warning(msg)
                             if self.strict:
@@ -365,7 +375,7 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if item.name.startswith("."):
                         continue
 
@@ -390,12 +400,12 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if item.name.startswith("."):
                         continue
 
                     if item.is_file():
-                        ext = item.suffix.lower()
+                        ext = os.path.splitext(item.name)[1].lower()
                         if ext not in [".png", ".jpg", ".jpeg"]:
                             msg = f"Invalid image format in {content_type}: {item.name}"
                             self.add_error(msg)
@@ -424,10 +434,11 @@ class PathValidator(StrictValidator):
                     name_map[base_name].append(str(rel_path))
 
             # Check base folder first
-            for item in base_path.iterdir():
+            for item in self._scan_dir(base_path):
                 if item.is_file() and not item.name.startswith("."):
-                    if self._is_valid_image(item):
-                        add_file(item)
+                    item_path = Path(item.path)
+                    if self._is_valid_image(item_path):
+                        add_file(item_path)
 
             # Check each content folder
             for folder in sorted(self.content_types):  # Sort folders for consistency
@@ -435,10 +446,11 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if item.is_file() and not item.name.startswith("."):
-                        if self._is_valid_image(item):
-                            add_file(item)
+                        item_path = Path(item.path)
+                        if self._is_valid_image(item_path):
+                            add_file(item_path)
 
             # Check for duplicates - ensure consistent sorting
             duplicates = {
@@ -479,9 +491,9 @@ class PathValidator(StrictValidator):
                         hash_map[content].append(str(rel_path))
 
             # Process base folder
-            for item in base_path.iterdir():
+            for item in self._scan_dir(base_path):
                 if item.is_file() and not item.name.startswith("."):
-                    add_file(item)
+                    add_file(Path(item.path))
 
             # Process content folders
             for folder in sorted(self.content_types):  # Sort folders for consistency
@@ -489,9 +501,9 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
+                for item in self._scan_dir(folder_path):
                     if item.is_file() and not item.name.startswith("."):
-                        add_file(item)
+                        add_file(Path(item.path))
 
             # Check for duplicates - ensure consistent sorting
             duplicates = [
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 VALID_TEXT_TYPES = {
@@ -17,6 +18,9 @@ DEFAULT_TEMPLATE = TEMPLATE_PATH / "default.json"
 
 VALID_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".PNG", ".JPG", ".JPEG"}
 
+# "#" followed by exactly 6 uppercase hex digits, nothing else
+HEX_COLOR_RE = re.compile(r"\A#[0-9A-F]{6}\Z")
+
 
 MULTI_COLOUR_SETTINGS_BACKUP = {
     "base_settings": {"default_text_type": "plain"},
@@ -6,7 +6,7 @@ from typing import Dict, List, Literal, Optional, Set, Union
 
 from config.logging import logger
 from content_manager.metadata.metadata import Metadata
-from content_manager.settings.settings_constants import VALID_TEXT_TYPES
+from content_manager.settings.settings_constants import HEX_COLOR_RE, VALID_TEXT_TYPES
 from content_manager.settings.settings_validator import SettingsValidator
 
 
@@ -124,6 +124,8 @@ class Settings:
         self.settings_validator = SettingsValidator()
         self.metadata = None
         self.base_path = None
+        # (template path, mtime_ns) -> settings that already passed validation
+        self._validated_cache: Dict[tuple[str, int], Dict] = {}
 
     def set_data(self, metadata: Metadata):
         """Use existing metadata instance.
@@ -188,9 +190,17 @@ class Settings:
             >>> my_settings = settings.load_template("default")
         """
         template_path = self.templates_dir / f"{name}.json"
-        if not template_path.exists():
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Template not found: {name}")
 
+        # Unchanged on disk since last validation - skip parse and validate
+        cache_key = (str(template_path), mtime_ns)
+        cached = self._validated_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         try:
             with open(template_path) as f:
                 settings = json.load(f)
@@ -200,6 +210,7 @@ class Settings:
         if not self.settings_validator.validate_settings(settings):
             raise ValueError(f"Invalid template: {name}")
 
+        self._validated_cache[cache_key] = copy.deepcopy(settings)
         return settings
 
     def list_fonts(self) -> List[str]:
@@ -392,29 +403,35 @@ class Settings:
                             f"Color missing required keys: {required_color_keys}"
                         )
 
-                    # Validate hex values
-                    for key in required_color_keys:
-                        if not isinstance(color[key], str) or not color[key].startswith(
-                            "#"
-                        ):
-                            raise ValueError(
-                                f"Invalid hex color for {key}: {color[key]}"
-                            )
+                # Validate hex values across the whole list in one pass
+                hex_match = HEX_COLOR_RE.match
+                invalid = next(
+                    (
+                        (key, color[key])
+                        for color in colors
+                        for key in required_color_keys
+                        if not isinstance(color[key], str) or not hex_match(color[key])
+                    ),
+                    None,
+                )
+                if invalid is not None:
+                    raise ValueError(f"Invalid hex color for {invalid[0]}: {invalid[1]}")
 
                 text_settings["colors"] = colors
 
+            # Individual position params given, as a 4-bit mask: bits 0-1 are
+            # the position ranges, bits 2-3 the jitters
+            position_mask = (
+                (vertical_position is not None)
+                | (horizontal_position is not None) << 1
+                | (vertical_jitter is not None) << 2
+                | (horizontal_jitter is not None) << 3
+            )
+
             # MODIFICATION :: position tuple
             if positions is not None:
                 # First check we're not mixing with individual params
-                if any(
-                    x is not None
-                    for x in [
-                        vertical_position,
-                        horizontal_position,
-                        vertical_jitter,
-                        horizontal_jitter,
-                    ]
-                ):
+                if position_mask:
                     raise ValueError(
                         "Cannot mix positions tuple with individual position parameters"
                     )
@@ -431,23 +448,15 @@ class Settings:
                 if h_jitter is not None:
                     text_settings["position"]["horizontal_jitter"] = h_jitter
             # MODIFICATION :: individual positions
-            elif any(
-                x is not None
-                for x in [
-                    vertical_position,
-                    horizontal_position,
-                    vertical_jitter,
-                    horizontal_jitter,
-                ]
-            ):
+            elif position_mask:
                 # Only update the values that are provided
-                if vertical_position is not None:
+                if position_mask & 0b0001:
                     text_settings["position"]["vertical"] = vertical_position
-                if horizontal_position is not None:
+                if position_mask & 0b0010:
                     text_settings["position"]["horizontal"] = horizontal_position
-                if vertical_jitter is not None:
+                if position_mask & 0b0100:
                     text_settings["position"]["vertical_jitter"] = vertical_jitter
-                if horizontal_jitter is not None:
+                if position_mask & 0b1000:
                     text_settings["position"]["horizontal_jitter"] = horizontal_jitter
 
             # MODIFICATION :: margins tuple
@@ -563,10 +572,12 @@ class Settings:
         if not self.settings_validator.validate_settings(settings):
             raise ValueError("Invalid settings")
 
-        # Save template
+        # Save template - encode in one pass so a failed encode never leaves
+        # a partial file behind and the file gets a single write
+        payload = json.dumps(settings, indent=2)
         try:
             with open(template_path, "w") as f:
-                json.dump(settings, f, indent=2)
+                f.write(payload)
         except IOError as e:
             raise IOError(f"Failed to save template: {str(e)}")
 
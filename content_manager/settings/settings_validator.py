@@ -1,8 +1,7 @@
-import re
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Union
 
-from content_manager.settings.settings_constants import VALID_TEXT_TYPES
+from content_manager.settings.settings_constants import HEX_COLOR_RE, VALID_TEXT_TYPES
 
 # TODO product settings cannot have duplicate settings!!!
 
@@ -248,7 +247,7 @@ class SettingsValidator:
         if not isinstance(color, str):
             return False
         # Match exactly: # followed by exactly 6 hex digits (0-9 or A-F)
-        return bool(re.match(r"^#[0-9A-F]{6}$", color))
+        return HEX_COLOR_RE.match(color) is not None
 
     def _validate_position(self, text_type: str, settings: Dict) -> bool:
         """Validate position settings in both dictionary and tuple formats."""
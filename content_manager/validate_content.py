@@ -1,9 +1,27 @@
 ## TODO add tests for this
 # this comes before running metadata validation
 
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
-def _validate_content(self, strict: bool = False) -> bool:
-    """Internal method to validate loaded content
+from config.logging import logger
+
+
+def _validate_content(
+    base_path: Union[str, Path],
+    content_types: List[str],
+    metadata: Optional[Dict] = None,
+    strict: bool = False,
+) -> bool:
+    """Validate loaded content
+
+    Args:
+        base_path: Root content directory
+        content_types: Content type folder names to check
+        metadata: Loaded metadata, if any
+        strict: Log the warnings together as one error instead of one
+            warning each. Either way the result is False.
 
     Validates:
     - Image existence and format
@@ -14,18 +32,28 @@ def _validate_content(self, strict: bool = False) -> bool:
     - Metadata consistency
     """
     warnings = []
+    base_str = os.fspath(base_path)
 
     try:
         # Validate images exist for each content type
-        for content_type in self.content_types:
-            content_path = self.base_path / content_type
-            if not content_path.exists():
+        for content_type in content_types:
+            try:
+                entries_iter = os.scandir(os.path.join(base_str, content_type))
+            except FileNotFoundError:
                 warnings.append(f"Content folder missing: {content_type}")
                 continue
+            except NotADirectoryError:
+                warnings.append(f"No images found in {content_type} folder")
+                continue
 
             # Check for images in content folder
-            images = list(content_path.glob("*.png")) + list(content_path.glob("*.PNG"))
-            if not images:
+            with entries_iter as entries:
+                has_png = any(
+                    entry.name.lower().endswith(".png")
+                    and entry.is_file()
+                    for entry in entries
+                )
+            if not has_png:
                 warnings.append(f"No images found in {content_type} folder")
 
             # Additional image validations could go here
@@ -34,7 +62,7 @@ def _validate_content(self, strict: bool = False) -> bool:
             # - Check settings existence
 
         # Validate metadata structure if it exists
-        if self.metadata:
+        if metadata:
             # Add metadata validation here
             pass
 
@@ -1,17 +1,95 @@
 from config.logging import logger
+import functools
+import gc
+import json
+import os
 import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from content_manager.settings.settings_constants import DEFAULT_TEMPLATE
 from text.generate_image import generate_image
+from text.layer_pool import LayerPool
 from PIL import Image  # type: ignore
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _load_default_template() -> dict:
+    """Load the default settings template once; it is read-only during generation"""
+    logger.debug("Loading default template from: %s", DEFAULT_TEMPLATE)
+    try:
+        with open(DEFAULT_TEMPLATE) as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load default template: {str(e)}")
+        raise
+
+
 class Generator:
     def __init__(self, base_path: Path, metadata: dict, captions: dict):
         self.base_path = base_path
         self.metadata = metadata
         self.captions = captions
         self.default_output_path = self.base_path / "output"
+        self._base_dir = os.fspath(self.base_path)
+        self._product_index = self._build_product_index()
+        self._prevent_duplicates = {}
+        for content_type, products in self.metadata.data["products"].items():
+            for prod_info in products:
+                self._prevent_duplicates.setdefault(
+                    (content_type, prod_info["name"]), prod_info["prevent_duplicates"]
+                )
+        # Products with exactly one image and no duplicate prevention always
+        # resolve to that image, so skip filtering and random selection
+        self._single_image = {
+            (content_type, product): images[0]
+            for content_type, by_product in self._product_index.items()
+            for product, images in by_product.items()
+            if len(images) == 1
+            and product != "all"
+            and not self._prevent_duplicates.get((content_type, product), False)
+        }
+        self._product_settings_index = self._build_product_settings_index()
+        # Product names per content type, used to reset duplicate tracking per post
+        self._used_images_template = {
+            content_type: [
+                product_info["name"]
+                for product_info in self.metadata.data["products"][content_type]
+            ]
+            for content_type in self.metadata.data["content_types"]
+        }
+        self._layer_pool = LayerPool()
+        self._created_dirs = set()
+
+    def _build_product_index(self) -> Dict[str, Dict[str, List[str]]]:
+        """Map content type -> product -> images, in metadata structure order"""
+        index = {}
+        images_data = self.metadata.data["images"]
+        for content_type in self.metadata.data["content_types"]:
+            by_product = index[content_type] = {}
+            for img in self.metadata.data["structure"][content_type]["images"]:
+                by_product.setdefault(images_data[img]["product"], []).append(img)
+        return index
+
+    def _build_product_settings_index(self) -> Dict[str, Dict[str, dict]]:
+        """Map content type -> product -> settings from the "[p1, p2]" group keys"""
+        index = {}
+        for content_type, groups in self.metadata.data["settings"].items():
+            by_product = index[content_type] = {}
+            for group, settings in groups.items():
+                if group == "content" or settings is None:
+                    continue
+                for product in group[1:-1].split(","):
+                    # First matching group wins, as in a linear scan
+                    by_product.setdefault(product.strip(), settings)
+        return index
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) once per generate() run"""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
 
     def _validate_output_path(
         self, custom_output_path: Optional[Union[Path, str]] = None
@@ -42,9 +120,9 @@ class Generator:
                 output_path = self.default_output_path
 
         # Ensure output directory exists
-        output_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_path)
 
-        logger.debug(f"Using output path: {output_path}")
+        logger.debug("Using output path: %s", output_path)
         return output_path
 
     def generate(
@@ -62,17 +140,14 @@ class Generator:
             allow_all_duplicates: If True, allows 'all' product to be used even for products with prevent_duplicates=true
             output_path: Optional custom output path. If invalid or None, uses default path
         """
-        logger.info(f"Starting generation of {variations} variations")
+        logger.info("Starting generation of %s variations", variations)
+
+        # Output folders may have been removed since a previous run
+        self._created_dirs.clear()
 
         # Validate and get output path
         output_path = self._validate_output_path(output_path)
 
-        import gc
-
-        gc_post_counter = (
-            0  # count # of posts we have done. collect garbace every 5 rounds.
-        )
-
         """
         Example header structure:
         headers = ['product_hook', 'hook', 'product_filler', 'filler', ...]
@@ -85,60 +160,88 @@ class Generator:
             for i in range(1, len(self.captions["headers"]) // 2 + 1)
         }
 
-        for variation_num in range(1, variations + 1):
+        # PIL releases the GIL while encoding, so saves run on worker threads.
+        # In-flight saves are capped to bound the number of open images.
+        max_workers = os.cpu_count() or 1
+        pending_saves = deque()
 
-            variation_path = output_path / f"variation{variation_num}"
-            logger.info(f"Processing variation {variation_num}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for variation_num in range(1, variations + 1):
 
-            # Process each row (post) in captions
-            for post_num, row in enumerate(self.captions["captions"], 1):
-                post_path = variation_path / f"post{post_num}"
-                post_path.mkdir(
-                    parents=True, exist_ok=True
-                )  # Create directory once per post
-                logger.info(f"Processing post {post_num}")
+                variation_path = output_path / f"variation{variation_num}"
+                logger.info("Processing variation %s", variation_num)
 
-                # Track used images for duplicate prevention
-                used_images = {
-                    content_type: {
-                        product_info["name"]: []  # Use product name as key
-                        for product_info in self.metadata.data["products"][content_type]
+                # Create every post directory up front
+                post_paths = [
+                    variation_path / f"post{post_num}"
+                    for post_num in range(1, len(self.captions["captions"]) + 1)
+                ]
+                for post_path in post_paths:
+                    self._ensure_dir(post_path)
+
+                # Process each row (post) in captions
+                for post_num, (row, post_path) in enumerate(
+                    zip(self.captions["captions"], post_paths), 1
+                ):
+                    logger.info("Processing post %s", post_num)
+                    post_dir = os.fspath(post_path)
+
+                    # Track used images for duplicate prevention
+                    used_images = {
+                        content_type: {name: set() for name in product_names}
+                        for content_type, product_names in self._used_images_template.items()
                     }
-                    for content_type in self.metadata.data["content_types"]
-                }
 
-                # Process each content piece in the row
-                for idx, (product, content) in enumerate(zip(row[::2], row[1::2]), 1):
-                    content_type = headers_map[idx]
-
-                    logger.debug(
-                        f"Processing {content_type} with product {product} and text: {content}"
-                    )
-
-                    if not content:  # Skip empty content
-                        logger.debug(f"Skipping empty content for {content_type}")
-                        continue
-
-                    # Generate and save image
-                    image = self._generate_single_image(
-                        content_type=content_type,
-                        product=product,
-                        text=content,
-                        used_images=used_images,
-                        allow_all_duplicates=allow_all_duplicates,
-                    )
-
-                    # Save image
-                    image_path = post_path / f"{idx}.png"
-                    image.save(image_path)
-                    image.close()
-                    logger.debug(
-                        f"Saved image {idx} for post {post_num} in variation {variation_num}"
-                    )
-
-                gc_post_counter += 1
-                if gc_post_counter % 5 == 0:  # Every 5 images
-                    gc.collect()  # Force garbage collection
+                    # Process each content piece in the row
+                    for idx, (product, content) in enumerate(zip(row[::2], row[1::2]), 1):
+                        content_type = headers_map[idx]
+
+                        logger.debug(
+                            "Processing %s with product %s and text: %s",
+                            content_type,
+                            product,
+                            content,
+                        )
+
+                        if not content:  # Skip empty content
+                            logger.debug("Skipping empty content for %s", content_type)
+                            continue
+
+                        # Generate and save image
+                        image = self._generate_single_image(
+                            content_type=content_type,
+                            product=product,
+                            text=content,
+                            used_images=used_images,
+                            allow_all_duplicates=allow_all_duplicates,
+                        )
+
+                        # Save image in the background
+                        image_path = os.path.join(post_dir, f"{idx}.png")
+                        pending_saves.append(
+                            executor.submit(self._save_image, image, image_path)
+                        )
+                        del image
+                        if len(pending_saves) > max_workers * 2:
+                            pending_saves.popleft().result()
+
+                # Images are closed as soon as they are saved, so one sweep per
+                # variation is enough to clear any leftover PIL cycles
+                gc.collect()
+
+            # Surface any save errors before returning
+            while pending_saves:
+                pending_saves.popleft().result()
+
+        # The generator outlives this run, so don't hold text layers between runs
+        self._layer_pool.clear()
+
+    def _save_image(self, image: Image.Image, image_path: str) -> None:
+        """Save a generated image and release it (runs on a worker thread)"""
+        with image:  # Frees the image core as soon as the save finishes
+            # Fast zlib level; slides are re-encoded by the platform on upload
+            image.save(image_path, format="PNG", compress_level=1, optimize=False)
+        logger.debug("Saved image %s", image_path)
 
     def _generate_single_image(
         self,
@@ -158,36 +261,40 @@ class Generator:
             allow_all_duplicates: If True, allows 'all' product to be used even for products
                                 with prevent_duplicates=true
         """
-        logger.debug(f"Generating image for {content_type} - {product}")
+        logger.debug("Generating image for %s - %s", content_type, product)
 
-        # Get available images
-        content_path = self.base_path / content_type
-        available_images = self._get_available_images(
-            content_type, product, used_images, allow_all_duplicates
+        selected_image = self._single_image.get(
+            (content_type, product.strip() if product else product)
         )
+        if selected_image is None:
+            # Get available images
+            available_images = self._get_available_images(
+                content_type, product, used_images, allow_all_duplicates
+            )
 
-        if not available_images:
-            raise ValueError(f"No available images for {content_type} - {product}")
+            if not available_images:
+                raise ValueError(f"No available images for {content_type} - {product}")
 
-        # Select and track image
-        selected_image = random.choice(available_images)
-        if self._should_prevent_duplicates(content_type, product):
-            used_images[content_type][product].append(selected_image)
+            # Select and track image
+            selected_image = random.choice(available_images)
+            if self._should_prevent_duplicates(content_type, product):
+                used_images[content_type][product].add(selected_image)
 
         # Get image settings
         image_settings = self._get_image_settings(content_type, product, selected_image)
         text_type = image_settings["base_settings"]["default_text_type"]
 
         # Generate image
-        logger.debug(f"Using image {selected_image} with text type {text_type}")
+        logger.debug("Using image %s with text type %s", selected_image, text_type)
         return generate_image(
             settings=image_settings,
             text_type=text_type,
-            colour_index=random.randint(
-                0, len(image_settings["text_settings"][text_type]["colors"]) - 1
+            colour_index=random.randrange(
+                len(image_settings["text_settings"][text_type]["colors"])
             ),
-            image_path=str(content_path / selected_image),
+            image_path=os.path.join(self._base_dir, content_type, selected_image),
             text=text,
+            layer_pool=self._layer_pool,
         )
 
     def _get_available_images(
@@ -198,16 +305,15 @@ class Generator:
         allow_all_duplicates: bool,
     ) -> List[str]:
         """Get list of available images for content type and product with improved duplicate handling"""
-        logger.debug(f"\n=== Getting Available Images ===")
-        logger.debug(f"Content Type: {content_type}")
+        logger.debug("\n=== Getting Available Images ===")
+        logger.debug("Content Type: %s", content_type)
 
         # Strip whitespace from product name
         product = product.strip() if product else product
-        logger.debug(f"Product (after stripping whitespace): {product}")
+        logger.debug("Product (after stripping whitespace): %s", product)
 
-        # Rest of the method remains the same
-        all_images = self.metadata.data["structure"][content_type]["images"]
-        logger.debug(f"Found images in metadata: {all_images}")
+        images_by_product = self._product_index[content_type]
+        logger.debug("Found images in metadata: %s", images_by_product)
 
         if product == "all":
             logger.debug("Processing 'all' product case")
@@ -220,18 +326,16 @@ class Generator:
                 prevent_duplicates = prod_info["prevent_duplicates"]
 
                 logger.debug(
-                    f"Checking product: {prod_name} (prevent_duplicates={prevent_duplicates})"
+                    "Checking product: %s (prevent_duplicates=%s)",
+                    prod_name,
+                    prevent_duplicates,
                 )
 
                 if prevent_duplicates and not allow_all_duplicates:
-                    logger.debug(f"Skipping {prod_name} due to duplicate prevention")
+                    logger.debug("Skipping %s due to duplicate prevention", prod_name)
                     continue
 
-                matching_images = [
-                    img
-                    for img in all_images
-                    if self.metadata.data["images"][img]["product"] == prod_name
-                ]
+                matching_images = images_by_product.get(prod_name, [])
 
                 if prevent_duplicates:
                     matching_images = [
@@ -240,21 +344,17 @@ class Generator:
                         if img not in used_images[content_type][prod_name]
                     ]
 
-                logger.debug(f"Adding {len(matching_images)} images from {prod_name}")
+                logger.debug("Adding %s images from %s", len(matching_images), prod_name)
                 available.extend(matching_images)
 
         else:
-            logger.debug(f"Processing specific product: {product}")
+            logger.debug("Processing specific product: %s", product)
 
-            available = [
-                img
-                for img in all_images
-                if self.metadata.data["images"][img]["product"] == product
-            ]
+            available = list(images_by_product.get(product, []))
 
             if self._should_prevent_duplicates(content_type, product):
-                logger.debug(f"Applying duplicate prevention for {product}")
-                logger.debug(f"Used images: {used_images[content_type][product]}")
+                logger.debug("Applying duplicate prevention for %s", product)
+                logger.debug("Used images: %s", used_images[content_type][product])
 
                 available = [
                     img
@@ -262,7 +362,7 @@ class Generator:
                     if img not in used_images[content_type][product]
                 ]
 
-            logger.debug(f"Found {len(available)} available images")
+            logger.debug("Found %s available images", len(available))
 
         if not available:
             logger.warning(f"No available images found for {content_type} - {product}")
@@ -271,38 +371,21 @@ class Generator:
 
     def _should_prevent_duplicates(self, content_type: str, product: str) -> bool:
         """Check if duplicates should be prevented for this content type and product"""
-        logger.debug(f"\n=== Checking Duplicate Prevention ===")
-        logger.debug(f"Content Type: {content_type}")
-
-        # Strip whitespace from product name
         product = product.strip() if product else product
-        logger.debug(f"Product (after stripping whitespace): {product}")
-
-        logger.debug(
-            f"Products in metadata: {self.metadata.data['products'][content_type]}"
-        )
-
-        for prod_info in self.metadata.data["products"][content_type]:
-            if prod_info["name"] == product:
-                should_prevent = prod_info["prevent_duplicates"]
-                logger.debug(f"Found product. Prevent duplicates: {should_prevent}")
-                return should_prevent
-
-        logger.debug("Product not found in metadata")
-        return False
+        return self._prevent_duplicates.get((content_type, product), False)
 
     def _get_image_settings(
         self, content_type: str, product: str, image_path: str
     ) -> dict:
         """Get settings for specific image, falling back through hierarchy as needed"""
-        logger.debug(f"\n=== Getting Image Settings ===")
-        logger.debug(f"Content Type: {content_type}")
-        logger.debug(f"Product: {product}")
-        logger.debug(f"Image path: {image_path}")
+        logger.debug("\n=== Getting Image Settings ===")
+        logger.debug("Content Type: %s", content_type)
+        logger.debug("Product: %s", product)
+        logger.debug("Image path: %s", image_path)
 
         # Extract filename from path
-        image_name = Path(image_path).name
-        logger.debug(f"Image name: {image_name}")
+        image_name = os.path.basename(image_path)
+        logger.debug("Image name: %s", image_name)
 
         try:
             # Get image metadata
@@ -311,17 +394,7 @@ class Generator:
 
             # Handle different settings sources
             if settings_source == "default":
-                # Import default template for default settings
-                from content_manager.settings.settings_constants import DEFAULT_TEMPLATE
-                import json
-
-                logger.debug(f"Loading default template from: {DEFAULT_TEMPLATE}")
-                try:
-                    with open(DEFAULT_TEMPLATE) as f:
-                        return json.load(f)
-                except (IOError, json.JSONDecodeError) as e:
-                    logger.error(f"Failed to load default template: {str(e)}")
-                    raise
+                return _load_default_template()
 
             elif settings_source == "custom":
                 if image_data["settings"] is None:
@@ -343,16 +416,12 @@ class Generator:
 
             elif settings_source == "product":
                 # Look for product settings
-                for group, settings in self.metadata.data["settings"][
-                    content_type
-                ].items():
-                    if group != "content":  # Skip content settings
-                        products = {p.strip() for p in group[1:-1].split(",")}
-                        if product in products and settings is not None:
-                            return settings
-                raise ValueError(
-                    f"No product settings found for {product} in {content_type}"
-                )
+                try:
+                    return self._product_settings_index[content_type][product]
+                except KeyError:
+                    raise ValueError(
+                        f"No product settings found for {product} in {content_type}"
+                    )
 
             else:
                 raise ValueError(f"Invalid settings_source: {settings_source}")
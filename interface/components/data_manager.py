@@ -1,4 +1,6 @@
+import os
 import streamlit as st
+from collections import defaultdict
 from pathlib import Path
 from typing import Set, Dict, Any, Optional, Tuple, List
 from content_manager.metadata.metadata import Metadata
@@ -6,6 +8,97 @@ from content_manager.metadata.metadata_editor import MetadataEditor
 import pandas as pd 
 from config.logging import logger
 
+
+REQUIREMENTS_COLUMNS = ("Content Type", "Product", "Min Required", "Current Count")
+
+
+def _metadata_view(metadata_data: Dict) -> Tuple[list, list, Dict[str, List[str]]]:
+    """Derive product requirements, untagged stats and warnings from metadata
+
+    Images and products are each walked once, shared by all three results.
+    """
+    # Images: bucket untagged images and flag missing products together
+    untagged_by_type = defaultdict(list)
+    missing_data = []
+    for img_name, img_data in metadata_data["images"].items():
+        if not img_data.get("product"):
+            untagged_by_type[img_data["content_type"]].append(img_name)
+            missing_data.append(f"{img_name} has no product assigned")
+
+    # Products: requirements rows and duplicate prevention warnings together.
+    # Rows cover every product with a requirement; each table filters them.
+    requirements_data = []
+    duplicate_prevention = []
+    for content_type, products in metadata_data["products"].items():
+        for prod in products:
+            prevent_duplicates = prod.get("prevent_duplicates", False)
+            min_occurrences = prod.get("min_occurrences", 0)
+            if not (prevent_duplicates or min_occurrences > 0):
+                continue
+            current_count = prod.get("current_count", 0)
+            requirements_data.append({
+                "Content Type": content_type,
+                "Product": prod["name"],
+                "Min Required": min_occurrences,
+                "Current Count": current_count,
+                "Prevent Duplicates": prevent_duplicates
+            })
+            if prevent_duplicates and current_count < min_occurrences:
+                duplicate_prevention.append(
+                    f"{content_type}/{prod['name']}: needs {min_occurrences} images (has {current_count})"
+                )
+
+    # Sort by content type then product
+    requirements_data.sort(key=lambda x: (x["Content Type"], x["Product"]))
+
+    untagged_stats = []
+    for content_type in sorted(metadata_data["content_types"]):
+        untagged = untagged_by_type.get(content_type)
+        if untagged:  # Only add to stats if there are untagged images
+            untagged_stats.append({
+                "Content Type": content_type,
+                "Untagged Count": len(untagged),
+                "Images": ", ".join(untagged)
+            })
+
+    warnings = {
+        "product_requirements": [],
+        "duplicate_prevention": duplicate_prevention,
+        "missing_data": missing_data
+    }
+    return requirements_data, untagged_stats, warnings
+
+
+# The view only changes when metadata does, so it is cached across reruns
+# keyed on DataManager.metadata_version(). Arguments starting with an
+# underscore are not hashed by streamlit.
+@st.cache_data(show_spinner=False)
+def _compute_metadata_view(metadata_version: Tuple, _metadata_data: Dict) -> Tuple[Optional[pd.DataFrame], list, list, Dict[str, List[str]]]:
+    """Cached duplicate prevention table, requirements table, untagged stats and categorized warnings"""
+    requirements_data, untagged_stats, warnings = _metadata_view(_metadata_data)
+
+    # Build the frame column-wise so pandas infers one dtype per column
+    # instead of merging a dict per row
+    duplicate_rows = [row for row in requirements_data if row["Prevent Duplicates"]]
+    requirements_df = None
+    if duplicate_rows:
+        requirements_df = pd.DataFrame({
+            column: [row[column] for row in duplicate_rows]
+            for column in REQUIREMENTS_COLUMNS
+        })
+
+    requirements_table = [
+        {
+            "Content Type": row["Content Type"],
+            "Product": row["Product"],
+            "Min Req": row["Min Required"],
+            "No Dupes": "Yes" if row["Prevent Duplicates"] else "No"
+        }
+        for row in requirements_data
+    ]
+    return requirements_df, requirements_table, untagged_stats, warnings
+
+
 class DataManager:
     """Manages data and metadata display"""
     
@@ -17,24 +110,54 @@ class DataManager:
         self.metadata = metadata
         self.metadata_data = metadata_data
         self.metadata_editor = metadata_editor
+        self._build_product_index()
         self.initialize_state()
         self.current_path = ""
         self.settings_level = "default"
         
     def initialize_state(self):
         """Initialize state for data tracking"""
+        # Session state outlives reruns, so only the first run needs to seed it
+        if st.session_state.get("_dm_initialized"):
+            return
+
         if "content_type" not in st.session_state:
-            st.session_state.content_type = list(self.content_types)[0]
+            st.session_state.content_type = next(iter(self.content_types))
             
         if "product" not in st.session_state:
             st.session_state.product = "all"
             
         if "selected_image" not in st.session_state:
             first_type_images = self.metadata_data["structure"][st.session_state.content_type]["images"]
-            st.session_state.selected_image = list(first_type_images)[0] if first_type_images else None
+            st.session_state.selected_image = next(iter(first_type_images), None)
             
         if "selected_data" not in st.session_state:
             st.session_state.selected_data = None
+
+        st.session_state._dm_initialized = True
+
+    def _build_product_index(self):
+        """Index products by content type and name for O(1) lookups"""
+        self._products_by_ct_name = {
+            ct: {p["name"]: p for p in plist}
+            for ct, plist in self.metadata_data["products"].items()
+        }
+        self._products_index_version = self.metadata_editor.version
+
+    def _lookup_product(self, content_type: str, product: str) -> Optional[Dict]:
+        """Get a product's metadata entry, rebuilding the index after edits"""
+        if self._products_index_version != self.metadata_editor.version:
+            self._build_product_index()
+        return self._products_by_ct_name.get(content_type, {}).get(product)
+
+    def metadata_version(self) -> Tuple:
+        """Key that changes whenever the metadata is edited or saved to disk"""
+        metadata_path = os.path.join(self.base_path, "metadata.json")
+        try:
+            mtime = os.stat(metadata_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        return (metadata_path, mtime, self.metadata_editor.version)
             
     def render_content(self):
         """Render content data with improved error handling and organization"""
@@ -45,6 +168,10 @@ class DataManager:
             return
             
         try:
+            requirements_df, _, untagged_stats, warnings = _compute_metadata_view(
+                self.metadata_version(), self.metadata_data
+            )
+
             # Get image data with validation
             image_data = self.metadata_data["images"].get(current_image)
             if not image_data:
@@ -70,11 +197,7 @@ class DataManager:
 
                 # Get and display product info with safety checks
                 if product:
-                    product_info = next(
-                        (p for p in self.metadata_data["products"][content_type] 
-                        if p["name"] == product),
-                        None
-                    )
+                    product_info = self._lookup_product(content_type, product)
                     if product_info:
                         st.write(f"Prevent Duplicates: {product_info.get('prevent_duplicates', False)}")
                         st.write(f"Min Required: {product_info.get('min_occurrences', 'NA')}")
@@ -87,23 +210,9 @@ class DataManager:
 
             # Products with Duplicate Prevention
             with st.expander("Product Requirements", expanded=True):
-                requirements_data = []
                 try:
-                    for content_type_iter, products in self.metadata_data["products"].items():
-                        for prod in products:
-                            if prod.get("prevent_duplicates", False):
-                                requirements_data.append({
-                                    "Content Type": content_type_iter,
-                                    "Product": prod["name"],
-                                    "Min Required": prod.get("min_occurrences", 0),
-                                    "Current Count": prod.get("current_count", 0)
-                                })
-                    
-                    if requirements_data:
-                        # Sort by content type then product
-                        requirements_data.sort(key=lambda x: (x["Content Type"], x["Product"]))
-                        df = pd.DataFrame(requirements_data)
-                        st.dataframe(df, hide_index=True)
+                    if requirements_df is not None:
+                        st.dataframe(requirements_df, hide_index=True)
                     else:
                         st.info("No products with duplicate prevention configured")
                 except Exception as e:
@@ -113,7 +222,6 @@ class DataManager:
             # Tagging Status
             with st.expander("Tagging Status", expanded=False):
                 try:
-                    untagged_stats = self.get_untagged_stats()
                     if untagged_stats:
                         st.write("Untagged Images:")
                         for stat in untagged_stats:
@@ -128,9 +236,12 @@ class DataManager:
             # Warnings
             with st.expander("Warnings", expanded=True):
                 try:
-                    warnings = self.get_metadata_warnings()
-                    if any(warnings.values()):
-                        for category, category_warnings in warnings.items():
+                    display_warnings = {
+                        "Duplicate Prevention": warnings["duplicate_prevention"],
+                        "Missing Data": warnings["missing_data"]
+                    }
+                    if any(display_warnings.values()):
+                        for category, category_warnings in display_warnings.items():
                             if category_warnings:  # Only show categories that have warnings
                                 st.write(f"**{category}:**")
                                 for warning in category_warnings:
@@ -166,20 +277,10 @@ class DataManager:
                 
 
         with st.expander("Product Requirements", expanded=True):
-            # Create list of requirements
-            requirements = []
-            for content_type, products in self.metadata_data["products"].items():
-                for prod in products:
-                    if prod.get("min_occurrences", 0) > 0 or prod.get("prevent_duplicates", False):
-                        requirements.append({
-                            "Content Type": content_type,
-                            "Product": prod["name"],
-                            "Min Req": prod.get("min_occurrences", 0),
-                            "No Dupes": "Yes" if prod.get("prevent_duplicates", False) else "No"
-                        })
-            
-            # Sort by content type then product
-            requirements.sort(key=lambda x: (x["Content Type"], x["Product"]))
+            # Sorted requirements shared with render_content
+            _, requirements, _, _ = _compute_metadata_view(
+                self.metadata_version(), self.metadata_data
+            )
             
             # Display as table
             if requirements:
@@ -220,33 +321,19 @@ class DataManager:
                 "product": "None"
             }
         
-        for p in self.metadata_data["products"][content_type]:
-            if p["name"] == current_product:
-                return {
-                    "prevent_duplicates": p.get("prevent_duplicates", False),
-                    "min_occurrences": p.get("min_occurrences", "NA") if p.get("prevent_duplicates", False) else "NA",
-                    "current_count": p.get("current_count", 0),
-                    "product": current_product
-                }
-        return None
+        p = self._lookup_product(content_type, current_product)
+        if p is None:
+            return None
+        return {
+            "prevent_duplicates": p.get("prevent_duplicates", False),
+            "min_occurrences": p.get("min_occurrences", "NA") if p.get("prevent_duplicates", False) else "NA",
+            "current_count": p.get("current_count", 0),
+            "product": current_product
+        }
 
     def get_untagged_stats(self) -> list:
         """Get stats about untagged images per content type"""
-        stats = []
-        for content_type in self.metadata_data["content_types"]:
-            untagged = []
-            for img_name, img_data in self.metadata_data["images"].items():
-                if img_data["content_type"] == content_type and not img_data.get("product"):
-                    untagged.append(img_name)
-            
-            if untagged:  # Only add to stats if there are untagged images
-                stats.append({
-                    "Content Type": content_type,
-                    "Untagged Count": len(untagged),
-                    "Images": ", ".join(untagged)
-                })
-        
-        return sorted(stats, key=lambda x: x["Content Type"])
+        return _metadata_view(self.metadata_data)[1]
 
     def get_metadata_warnings(self) -> Dict[str, List[str]]:
         """Get current metadata warnings as categorized dict"""
@@ -260,27 +347,6 @@ class DataManager:
             return {"Error": [f"Error getting warnings: {str(e)}"]}
 
     def validate_metadata(self) -> Tuple[bool, List[Dict[str, List[str]]]]:
-        warnings = {
-            "product_requirements": [],
-            "duplicate_prevention": [],
-            "missing_data": []
-        }
         errors = []
-        
-        # Check images without products and custom settings
-        for img_name, img_data in self.metadata_data['images'].items():
-            if not img_data.get('product'):
-                warnings["missing_data"].append(f"{img_name} has no product assigned")
-            # if img_data.get('settings_source') == 'custom':
-                # warnings["missing_data"].append(f"{img_name} has custom settings")
-
-        # Only show warnings for products with prevent_duplicates=True
-        for content_type, products in self.metadata_data['products'].items():
-            for product in products:
-                if product['prevent_duplicates']:  # First check if duplicate prevention is enabled
-                    if product['current_count'] < product['min_occurrences']:
-                        warnings["duplicate_prevention"].append(
-                            f"{content_type}/{product['name']}: needs {product['min_occurrences']} images (has {product['current_count']})"
-                        )
-
-        return len(errors) == 0, warnings
\ No newline at end of file
+        warnings = _metadata_view(self.metadata_data)[2]
+        return len(errors) == 0, warnings
@@ -1,11 +1,47 @@
+import functools
+import os
 from pathlib import Path
 import streamlit as st
-from typing import Set, Dict, Any
+from typing import Set, Dict, Any, Optional, Union
 from config.logging import logger
 from content_manager.settings.settings_constants import VALID_IMAGE_EXTENSIONS
 from content_manager.metadata.metadata import Metadata
 from content_manager.metadata.metadata_editor import MetadataEditor
-from PIL import Image
+from interface.components.thumbnails import thumbnail_bytes
+
+
+_ERR_NOT_FOUND = "Image not found: %s"
+_ERR_INVALID = "Invalid image type: %s"
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _load_image_bytes(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """Read an image file once per (path, mtime, size) so reruns reuse the bytes"""
+    return Path(path_str).read_bytes()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _thumb_bytes(path_str: str, mtime_ns: int, size: int, max_side: int = 1600, quality: int = 85) -> bytes:
+    """Downscale an image to fit max_side and encode it for display
+
+    Full resolution photos are otherwise sent to the browser and scaled there.
+    """
+    return thumbnail_bytes(path_str, max_side, quality)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_image_path(base_path: Path, content_type: str, image_name: str) -> Path:
+    """Build (once) the path of an original image in its content folder"""
+    return base_path / content_type / image_name
+
+
+def _stat_or_none(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a file, returning None when it does not exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
 
 class ImageManager:
     """Simple image display manager"""
@@ -16,31 +52,30 @@ class ImageManager:
         self.content_types = content_types
         self.products = products
         self.metadata = metadata
-        self.valid_extensions = VALID_IMAGE_EXTENSIONS
+        self.valid_extensions = frozenset(e.lower() for e in VALID_IMAGE_EXTENSIONS)
         self.metadata_data = metadata_data
         self.metadata_editor = metadata_editor
         self.initialize_state()
         
     def initialize_state(self):
         """Initialize image display state"""
-        if "current_image" not in st.session_state:
-            st.session_state.current_image = None
-            
-        if "image_settings" not in st.session_state:
-            st.session_state.image_settings = None
+        st.session_state.setdefault("current_image", None)
+        st.session_state.setdefault("image_settings", None)
     
     def display_image(self, image_path: Path):
         """Display a single image"""
-        if not image_path.exists():
-            st.error(f"Image not found: {image_path}")
+        # One stat serves as both the existence check and the cache key
+        stat = _stat_or_none(image_path)
+        if stat is None:
+            st.error(_ERR_NOT_FOUND % image_path)
             return
             
-        if image_path.suffix not in self.valid_extensions:
-            st.error(f"Invalid image type: {image_path.suffix}")
+        if image_path.suffix.lower() not in self.valid_extensions:
+            st.error(_ERR_INVALID % image_path.suffix)
             return
             
         try:
-            st.image(str(image_path))
+            st.image(_load_image_bytes(str(image_path), stat.st_mtime_ns, stat.st_size))
         except Exception as e:
             st.error(f"Error displaying image: {e}")
 
@@ -56,20 +91,32 @@ class ImageManager:
             return
             
         try:
-            # Check if a preview image exists
-            if "preview_image_path" in st.session_state:
-                image_path = Path(st.session_state.preview_image_path)
-                if not image_path.exists():
-                    # If preview doesn't exist, fall back to original
-                    image_path = self.base_path / st.session_state.content_type / st.session_state.selected_image
-                logger.debug(f"Using preview image path: {image_path}")
+            # Prefer the preview, falling back to the original. One stat per
+            # candidate doubles as the existence check and the thumbnail cache
+            # key. It is not kept across reruns since previews are regenerated
+            # in place.
+            original_path = _resolve_image_path(self.base_path, st.session_state.content_type, st.session_state.selected_image)
+            candidates = (
+                ("preview", st.session_state.get("preview_image_path")),
+                ("original", original_path),
+            )
+            for source, candidate in candidates:
+                if candidate is None:
+                    continue
+                stat = _stat_or_none(candidate)
+                if stat is not None:
+                    image_path = str(candidate)
+                    break
             else:
-                # Use original image path
-                image_path = self.base_path / st.session_state.content_type / st.session_state.selected_image
-                logger.debug(f"Using original image path: {image_path}")
+                st.error(_ERR_NOT_FOUND % original_path)
+                return
+            logger.debug("Using %s image path: %s", source, image_path)
             
-            # Display the image
-            st.image(str(image_path), use_container_width=True)
+            # Display a bounded thumbnail, rebuilt only when the file changes
+            st.image(
+                _thumb_bytes(image_path, stat.st_mtime_ns, stat.st_size),
+                use_container_width=True,
+            )
             
         except Exception as e:
             logger.error(f"Error displaying image: {str(e)}")
@@ -0,0 +1,24 @@
+import io
+from typing import Union
+from pathlib import Path
+
+from PIL import Image
+
+
+def thumbnail_bytes(path: Union[str, Path], max_side: int = 1600, quality: int = 85) -> bytes:
+    """Downscale an image to fit max_side and encode it for display
+
+    Opaque images become JPEG. Images with transparency stay PNG, since
+    flattening them to JPEG would show whatever colour sits under the
+    transparent pixels instead of the original's see-through areas.
+    """
+    with Image.open(path) as im:
+        buf = io.BytesIO()
+        if im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info:
+            thumb = im.convert("RGBA")
+            thumb.thumbnail((max_side, max_side), Image.LANCZOS)
+            thumb.save(buf, "PNG", compress_level=1)
+        else:
+            im.thumbnail((max_side, max_side), Image.LANCZOS)
+            im.convert("RGB").save(buf, "JPEG", quality=quality, optimize=True, progressive=True)
+    return buf.getvalue()
@@ -7,6 +7,7 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -151,22 +152,32 @@ class Interface:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 5:  # Change to 5 to account for all arguments
-        print(
-            "Usage: streamlit run main.py -- <base_path> <content_types> <products> <separator>"
-        )
-        sys.exit(1)
-
-    # print("Command line arguments:", sys.argv)
-    base_path = Path(sys.argv[1])
-    try:
-        content_types = ast.literal_eval(sys.argv[2])
-        products = ast.literal_eval(sys.argv[3])
-        separator = sys.argv[4]  # Get the separator argument
-        
-    except Exception as e:
-        print(f"Error parsing arguments: {e}")
-        raise
+    state_path = os.environ.get("SLIDE_STATE_PATH")
+    if state_path:
+        # Launched by SlideManager.open_interface with its validated state
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+        base_path = Path(state["base_path"])
+        content_types = state["content_types"]
+        products = state["products"]
+        separator = state["separator"]
+    else:
+        if len(sys.argv) != 5:  # Change to 5 to account for all arguments
+            print(
+                "Usage: streamlit run main.py -- <base_path> <content_types> <products> <separator>"
+            )
+            sys.exit(1)
+
+        # print("Command line arguments:", sys.argv)
+        base_path = Path(sys.argv[1])
+        try:
+            content_types = ast.literal_eval(sys.argv[2])
+            products = ast.literal_eval(sys.argv[3])
+            separator = sys.argv[4]  # Get the separator argument
+            
+        except Exception as e:
+            print(f"Error parsing arguments: {e}")
+            raise
     interface = Interface(
         base_path, content_types, products, separator
     )  # Pass separator to Interface
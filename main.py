@@ -1,6 +1,9 @@
+import functools
 import json
+import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Union
 
@@ -8,14 +11,76 @@ from config.logging import TESTING_LEVEL, TRACE_LEVEL, logger, setup_slide_logge
 from content_manager.content_handler import ContentHandler
 from content_manager.settings.settings_handler import Settings
 from content_manager.captions import CaptionsHelper
-from generation.generate import Generator
 from tools.generation_report import report
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_captions(
+    path_str: str, mtime_ns: int, size: int, separator: str, ct_key: tuple, prod_key: tuple
+) -> Dict:
+    """Parse captions.csv once per file version, separator and content structure
+
+    The returned dict is shared between calls and must be treated as read-only.
+    """
+    return CaptionsHelper.get_captions(
+        Path(path_str),
+        content_types=ct_key,
+        products={ct: list(prods) for ct, prods in prod_key},
+        separator=separator,
+    )
+
+
+def _format_messages(title: str, messages: List[str]) -> str:
+    """Format a titled bullet list so it can be printed in one call"""
+    return "\n" + title + "".join(f"\n  - {msg}" for msg in messages)
+
+
+# Folders written by generation and the interface, not read by validation
+_GENERATED_DIRS = frozenset({"output", "preview"})
+
+
+def _tree_signature(base_path: Path) -> int:
+    """Fingerprint the content validation reads by path, mtime and size
+
+    Covers the top level files (captions.csv, metadata.json) and every file
+    in the content folders. Generated output/ and preview/ folders are
+    skipped, so rendering slides does not change the signature.
+    """
+    entries = []
+    with os.scandir(base_path) as it:
+        top_level = list(it)
+    for entry in top_level:
+        if entry.name.lower() in _GENERATED_DIRS:
+            continue
+        if entry.is_dir():
+            # The folder itself counts, so an added empty folder is noticed
+            entries.append((entry.path, 0, 0))
+            for root, _, files in os.walk(entry.path):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((path, stat.st_mtime_ns, stat.st_size))
+        else:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    entries.sort()
+    return hash(tuple(entries))
+
 
 class SlideManager:
     """Main manager for slide content and generation"""
 
+    # Streamlit launch command, resolved once. Launch state is passed through
+    # SLIDE_STATE_PATH rather than argv, so the command never changes.
+    _interface_path = str(Path(__file__).parent / "interface" / "main.py")
+    _streamlit_cmd = [sys.executable, "-m", "streamlit", "run", _interface_path]
+
     def __init__(self, log_level: str = "INFO"):
         """Initialize manager
 
@@ -29,6 +94,10 @@ class SlideManager:
         self.logger = setup_slide_logger(log_level)
         self.metadata = None  # Initialize as None
         self.separator = ","  # Default separator
+        self._validation_key = None  # (base_path, separator, tree signature) of last passing validation
+        self._struct_cache = (0, 0, "")  # (id, len, json) of the last printed products
+        self._generator = None  # Reused while content and captions are unchanged
+        self._generator_key = None
 
     def help(self):
         """prints some useful info and helper function."""
@@ -46,6 +115,12 @@ print issues with metadat and warnings :: metadata.print_warnings
             self.content_handler = ContentHandler(strict=True)
             self.content_handler.separator = self.separator
             self.metadata = None
+            self._validation_key = None
+            # The old products dict is freed here and its id may be reused
+            self._struct_cache = (0, 0, "")
+
+    def _current_validation_key(self) -> tuple:
+        return (self.base_path, self.separator, _tree_signature(self.base_path))
 
     def load(self, path: Union[Path, str], strict: bool = True, separator: str = ",") -> bool:
         """Load and validate content from the specified path
@@ -58,7 +133,7 @@ print issues with metadat and warnings :: metadata.print_warnings
         Returns:
             bool: True if validation passes, False if errors/warnings exist
         """
-        logger.debug(f"Loading with separator: {separator}")
+        logger.debug("Loading with separator: %s", separator)
         self.separator = separator
         self.base_path = Path(path)
         
@@ -73,29 +148,32 @@ print issues with metadat and warnings :: metadata.print_warnings
         if is_valid:
             self.settings.set_data(metadata=self.content_handler.metadata)
             self.metadata = self.content_handler.metadata
+            self._validation_key = self._current_validation_key()
 
         # Always show validation results
         if self.content_handler.metadata and self.content_handler.metadata.warnings:
-            print("\nWarnings:")
-            for warning in self.content_handler.metadata.warnings:
-                print(f"  - {warning}")
+            print(_format_messages("Warnings:", self.content_handler.metadata.warnings))
         else:
             print("\nNo warnings")
 
         if self.content_handler.errors:
-            print("\nErrors:")
-            for error in self.content_handler.errors:
-                print(f"  - {error}")
+            print(_format_messages("Errors:", self.content_handler.errors))
         else:
             print("No errors")
 
         if is_valid:
             captions_path = self.base_path / "captions.csv"
-            self.captions = CaptionsHelper.get_captions(
-                captions_path,
-                content_types=self.content_handler.content_types,
-                products=self.content_handler.products,
-                separator=self.separator
+            stat = os.stat(captions_path)
+            self.captions = _cached_captions(
+                str(captions_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.separator,
+                tuple(self.content_handler.content_types),
+                tuple(
+                    (ct, tuple(prods))
+                    for ct, prods in self.content_handler.products.items()
+                ),
             )
 
         return is_valid
@@ -115,7 +193,7 @@ print issues with metadat and warnings :: metadata.print_warnings
         # Reset state before validating
         self._reset_state()
             
-        logger.debug(f"Validating with separator: {self.separator}")
+        logger.debug("Validating with separator: %s", self.separator)
         is_valid = self.content_handler.validate(
             path=self.base_path, 
             strict=strict,
@@ -126,26 +204,23 @@ print issues with metadat and warnings :: metadata.print_warnings
         if is_valid:
             self.settings.set_data(metadata=self.content_handler.metadata)
             self.metadata = self.content_handler.metadata
+            self._validation_key = self._current_validation_key()
 
         # Show ALL validation messages as errors in strict mode
         if strict:
-            # Combine messages but remove duplicates using a set
-            all_messages = list(
-                set(self.content_handler.errors + self.content_handler.warnings)
+            # Combine messages, dropping duplicates, sorted for consistent output
+            all_messages = sorted(
+                dict.fromkeys(self.content_handler.errors + self.content_handler.warnings)
             )
             if all_messages:
-                print("\nValidation failed with errors:")
-                for msg in sorted(all_messages):  # Sort for consistent output
-                    print(f"  - {msg}")
+                print(_format_messages("Validation failed with errors:", all_messages))
         else:
-            if self.content_handler.warnings:
-                print("\nValidation warnings:")
-                for warning in sorted(self.content_handler.warnings):
-                    print(f"  - {warning}")
-            if self.content_handler.errors:
-                print("\nValidation failed with errors:")
-                for error in sorted(self.content_handler.errors):
-                    print(f"  - {error}")
+            warnings = sorted(dict.fromkeys(self.content_handler.warnings))
+            if warnings:
+                print(_format_messages("Validation warnings:", warnings))
+            errors = sorted(dict.fromkeys(self.content_handler.errors))
+            if errors:
+                print(_format_messages("Validation failed with errors:", errors))
 
         return is_valid
 
@@ -154,35 +229,49 @@ print issues with metadat and warnings :: metadata.print_warnings
         if not self.base_path:
             raise ValueError("No path set - please call load() first")
             
-        logger.debug(f"Opening interface - validating with separator: {self.separator}")
-        if not self.validate(strict=False):  # Uses stored separator
-            raise ValueError("cant load interface bc validation is False")
+        # Skip revalidating when nothing changed since the last passing validation
+        if self._validation_key is not None and self._validation_key == self._current_validation_key():
+            logger.debug("Opening interface - content unchanged since last validation")
+        else:
+            logger.debug("Opening interface - validating with separator: %s", self.separator)
+            if not self.validate(strict=False):  # Uses stored separator
+                raise ValueError("cant load interface bc validation is False")
+
+        # Hand the already validated structure to the interface as compact JSON
+        # instead of stringified Python reprs on argv
+        payload = json.dumps(
+            {
+                "base_path": str(self.base_path),
+                "content_types": sorted(self.content_handler.content_types),
+                "products": {
+                    ct: list(prods)
+                    for ct, prods in self.content_handler.products.items()
+                },
+                "separator": self.separator,
+            },
+            separators=(",", ":"),
+        )
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", encoding="utf-8", delete=False
+        ) as f:
+            f.write(payload)
+            state_path = f.name
 
         try:
             # Initialize Streamlit through subprocess to avoid context warnings
-            interface_path = Path(__file__).parent / "interface" / "main.py"
-            logger.debug(f"Launching Streamlit with interface at: {interface_path}")
-
-            # Build and print command before executing
-            cmd = [
-                sys.executable,
-                "-m",
-                "streamlit",
-                "run",
-                str(interface_path),
-                "--",
-                str(self.base_path),  # Pass base path
-                str(self.content_handler.content_types),  # Pass content types
-                str(self.content_handler.products),  # Pass products
-                str(self.separator),  # Pass separator
-            ]
+            logger.debug("Launching Streamlit with interface at: %s", self._interface_path)
+            cmd = self._streamlit_cmd
 
             print(cmd)
 
-            subprocess.run(cmd, check=True)
+            subprocess.run(
+                cmd, check=True, env={**os.environ, "SLIDE_STATE_PATH": state_path}
+            )
         except subprocess.CalledProcessError as e:
             logger.error(f"Error launching interface: {e}")
             raise
+        finally:
+            os.unlink(state_path)
 
     @report
     def generate(self, variations: int = 2, allow_all_duplicates: bool = False, 
@@ -202,9 +291,19 @@ print issues with metadat and warnings :: metadata.print_warnings
                 return None
                 
             logger.info("Starting generation after successful validation")
-            
-            generator = Generator(self.base_path, self.metadata, self.captions)
-            generator.generate(variations, allow_all_duplicates, output_path)
+
+            # validate() reloads metadata on every call, so the generator is keyed
+            # on the content tree signature rather than the metadata object.
+            # The signature leaves out output/, so slides written by the
+            # previous run to the default path do not invalidate it.
+            key = (self._validation_key, id(self.captions))
+            if self._generator is None or self._generator_key != key:
+                # Imported here so load/validate don't pay for PIL and the renderers
+                from generation.generate import Generator
+
+                self._generator = Generator(self.base_path, self.metadata, self.captions)
+                self._generator_key = key
+            self._generator.generate(variations, allow_all_duplicates, output_path)
             
             # Return the actual output path used
             return str(output_path or "output")
@@ -222,7 +321,12 @@ print issues with metadat and warnings :: metadata.print_warnings
         products = self.content_handler.captions_validator.products
 
         if format == "raw":
-            print(json.dumps(products, indent=2))
+            # products is rebuilt by every validation, so its identity and size
+            # tell us whether the cached dump is still current
+            key = (id(products), len(products))
+            if self._struct_cache[:2] != key:
+                self._struct_cache = (*key, json.dumps(products, indent=2))
+            print(self._struct_cache[2])
         else:
             print("\n=== Content Structure ===")
             for content_type, product_list in products.items():
@@ -0,0 +1,53 @@
+import unittest
+
+from text.layer_pool import LayerPool
+
+
+class TestLayerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = LayerPool(max_per_size=2, max_sizes=3)
+
+    def test_reuses_released_layer(self):
+        """A released layer is cleared and handed out again for its size"""
+        layer = self.pool.acquire((20, 10))
+        layer.paste((255, 0, 0, 255), (0, 0, 5, 5))
+        self.pool.release(layer)
+
+        reused = self.pool.acquire((20, 10))
+        self.assertIs(reused, layer)
+        self.assertEqual(reused.getbbox(), None)  # fully transparent again
+
+    def test_per_size_cap(self):
+        """At most max_per_size layers are kept for one size"""
+        layers = [self.pool.acquire((8, 8)) for _ in range(4)]
+        for layer in layers:
+            self.pool.release(layer)
+        self.assertEqual(len(self.pool), 2)
+
+    def test_many_sizes_stay_bounded(self):
+        """Distinct sizes beyond max_sizes evict the least recently used"""
+        for width in range(1, 51):
+            for layer in [self.pool.acquire((width, 4)) for _ in range(2)]:
+                self.pool.release(layer)
+            self.assertLessEqual(len(self.pool), 6)  # max_sizes * max_per_size
+
+        # The most recent sizes are the ones kept
+        self.assertEqual(list(self.pool._free), [(48, 4), (49, 4), (50, 4)])
+
+    def test_recently_used_size_is_kept(self):
+        """Using a size marks it recent so it outlives newer, idle sizes"""
+        for width in (1, 2, 3):
+            self.pool.release(self.pool.acquire((width, 4)))
+        self.pool.release(self.pool.acquire((1, 4)))  # touch the oldest size
+        self.pool.release(self.pool.acquire((4, 4)))
+        self.assertEqual(list(self.pool._free), [(3, 4), (1, 4), (4, 4)])
+
+    def test_clear(self):
+        """clear() empties the pool"""
+        self.pool.release(self.pool.acquire((8, 8)))
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,34 +36,86 @@
 Want me to create the first test class structure?
 """
 
-import copy
-import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from content_manager.metadata.metadata import Metadata
+from content_manager.metadata import metadata_validator
 from content_manager.metadata.metadata_validator import MetadataValidator
 from content_manager.metadata.metadata_editor import MetadataEditor
 from content_manager.metadata.metadata_generator import MetadataGenerator
-from tests.test_utils import EXAMPLE_METADATA, DEFAULT_SETTINGS
+from tests.test_utils import EXAMPLE_METADATA, json_clone, metadata_with_data
+
+# Paths are immutable, so the fake base path is built once
+_FAKE_BASE = Path("/fake/path")
+
+_PIL_IMAGE_OPEN = "PIL.Image.open"
+
+# Expected values read from EXAMPLE_METADATA
+_EXPECTED_CONTENT_TYPES = ["content", "cta", "hook"]
+_EXPECTED_HOOK_IMAGES = frozenset({"1h.PNG", "2h.PNG", "3h.png", "4h.png"})
+
+# Valid products listed by the validator's missing-product warning for a
+# content type whose only product is product1
+_EXPECTED_PRODUCTS_STR = "['all', ['product1']]"
+
+# Settings written by the edit_settings tests; the editor stores but never
+# mutates them
+_EDITED_SETTINGS = {
+    "base_settings": {"default_text_type": "plain"},
+    "text_settings": {"plain": {"font_size": 80}},
+}
+
+# Attribute names for Path mocks. A list spec is not re-introspected with
+# dir() on every MagicMock(spec=...) construction.
+_PATH_SPEC = dir(Path)
+
+
+def _mock_pil_image(mock_open: MagicMock, size=(1920, 1080)) -> MagicMock:
+    """Make a patched PIL.Image.open yield an image of the given size"""
+    mock_image = MagicMock()
+    mock_image.size = size
+    mock_open.return_value.__enter__.return_value = mock_image
+    return mock_image
+
+
+def _clone_for_mutation(data: dict, *path) -> dict:
+    """Copy data only along path so the branch at its end can be mutated
+
+    Each container on the path is shallow copied; sibling sub-trees stay
+    shared with the original, which must therefore not be mutated elsewhere.
+    """
+    root = node = dict(data)
+    for key in path:
+        child = node[key]
+        node[key] = child = dict(child) if isinstance(child, dict) else list(child)
+        node = child
+    return root
 
 
 class TestMetadata(unittest.TestCase):
-    def setUp(self):
-        """Create fresh metadata instance with test data for each test"""
-        self.base_path = Path("/fake/path")
-        self.metadata = Metadata(base_path=self.base_path)
-        self.metadata.data = copy.deepcopy(EXAMPLE_METADATA)
-        self.test_settings = copy.deepcopy(DEFAULT_SETTINGS)
+    @classmethod
+    def setUpClass(cls):
+        """Build the metadata handler once for the class
 
-        # Initialize metadata editor with data
-        self.metadata.metadata_editor = MetadataEditor(self.metadata.data)
+        These tests only read metadata, so they share one handler and
+        fixture copy. Tests that edit it belong in TestMetadataEditor,
+        which copies per test.
+        """
+        cls._metadata = metadata_with_data(json_clone(EXAMPLE_METADATA), _FAKE_BASE)
+
+    def setUp(self):
+        """Point each test at the shared metadata handler"""
+        self.base_path = _FAKE_BASE
+        self.metadata = self._metadata
 
     def test_get_content_types(self):
         """Test getting content types"""
-        expected = ["content", "cta", "hook"]
-        self.assertEqual(self.metadata.metadata_editor.get_content_types(), expected)
+        self.assertListEqual(
+            self.metadata.metadata_editor.get_content_types(), _EXPECTED_CONTENT_TYPES
+        )
 
     def test_get_products(self):
         """Test getting products for content type"""
@@ -75,16 +127,27 @@ class TestMetadata(unittest.TestCase):
     def test_get_images(self):
         """Test getting images for content type"""
         hook_images = self.metadata.metadata_editor.get_images("hook")
-        expected = ["1h.PNG", "2h.PNG", "3h.png", "4h.png"]
-        self.assertEqual(sorted(hook_images), sorted(expected))
-
-    def test_get_settings(self):
-        """Test getting settings for content type"""
-        # Get settings for hook content type
-        hook_settings = self.metadata.metadata_editor.get_settings(
-            "content_type", "hook"
-        )
+        self.assertEqual(set(hook_images), _EXPECTED_HOOK_IMAGES)
 
+    # (name, get_settings args, check method) for each settings level
+    _GET_SETTINGS_CASES = (
+        ("content_type", ("content_type", "hook"), "_check_content_type_settings"),
+        ("default", ("default",), "_check_default_settings"),
+        ("product", ("product", "magnesium", "hook"), "_check_product_settings"),
+        # 2cta.PNG has custom settings in the example data
+        ("custom", ("custom", "2cta.PNG"), "_check_custom_settings"),
+        ("invalid_product", ("product", "invalid_product", "hook"), "_check_no_settings"),
+    )
+
+    # (name, get_settings args) that must raise ValueError
+    _GET_SETTINGS_ERRORS = (
+        ("invalid_content_type", ("content_type", "invalid_type")),
+        # content_type missing for product settings
+        ("missing_content_type", ("product", "magnesium")),
+    )
+
+    def _check_content_type_settings(self, hook_settings):
+        """Content type settings for hook"""
         # Check that settings exist and have expected structure
         self.assertIsNotNone(hook_settings)
         self.assertEqual(hook_settings["settings_source"], "content_type")
@@ -95,19 +158,14 @@ class TestMetadata(unittest.TestCase):
         self.assertEqual(settings["base_settings"]["default_text_type"], "plain")
         self.assertEqual(settings["text_settings"]["plain"]["font_size"], 70)
 
-    def test_get_settings_default(self):
-        """Test getting default settings"""
-        default_settings = self.metadata.metadata_editor.get_settings("default")
+    def _check_default_settings(self, default_settings):
+        """Default settings"""
         self.assertIsNotNone(default_settings)
         self.assertEqual(default_settings["settings_source"], "default")
         self.assertIsNotNone(default_settings["settings"])
 
-    def test_get_settings_product(self):
-        """Test getting product-specific settings"""
-        # Test magnesium product settings in hook content type
-        settings = self.metadata.metadata_editor.get_settings(
-            "product", "magnesium", "hook"
-        )
+    def _check_product_settings(self, settings):
+        """Magnesium product settings in hook content type"""
         self.assertIsNotNone(settings)
         self.assertEqual(settings["settings_source"], "product")
 
@@ -126,37 +184,35 @@ class TestMetadata(unittest.TestCase):
         self.assertEqual(text_settings["position"]["vertical"], [0.8, 0.9])
         self.assertEqual(text_settings["position"]["horizontal"], [0.45, 0.55])
 
-    def test_get_settings_custom(self):
-        """Test getting custom image settings"""
-        # 2cta.PNG has custom settings in the example data
-        settings = self.metadata.metadata_editor.get_settings("custom", "2cta.PNG")
+    def _check_custom_settings(self, settings):
+        """Custom image settings"""
         self.assertIsNotNone(settings)
         self.assertEqual(settings["settings_source"], "custom")
         self.assertIsNotNone(settings["settings"])
 
-    def test_get_settings_invalid_content_type(self):
-        """Test getting settings for invalid content type"""
-        with self.assertRaises(ValueError):
-            self.metadata.metadata_editor.get_settings("content_type", "invalid_type")
-
-    def test_get_settings_invalid_product(self):
-        """Test getting settings for invalid product"""
-        settings = self.metadata.metadata_editor.get_settings(
-            "product", "invalid_product", "hook"
-        )
+    def _check_no_settings(self, settings):
+        """Settings for an unknown product"""
         self.assertIsNotNone(settings)
         self.assertIsNone(settings["settings"])
 
-    def test_get_settings_missing_content_type(self):
-        """Test error when content_type missing for product settings"""
-        with self.assertRaises(ValueError):
-            self.metadata.metadata_editor.get_settings("product", "magnesium")
+    def test_get_settings(self):
+        """Test getting settings at each level"""
+        for name, args, check in self._GET_SETTINGS_CASES:
+            with self.subTest(name=name):
+                getattr(self, check)(self.metadata.metadata_editor.get_settings(*args))
+
+    def test_get_settings_errors(self):
+        """Test invalid get_settings requests raise ValueError"""
+        for name, args in self._GET_SETTINGS_ERRORS:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.metadata.metadata_editor.get_settings(*args)
 
     def test_metadata_structure(self):
         """Test basic metadata structure"""
-        required_keys = ["content_types", "products", "images", "settings", "structure"]
-        for key in required_keys:
-            self.assertIn(key, self.metadata.data)
+        required_keys = {"content_types", "products", "images", "settings", "structure"}
+        missing = required_keys - self.metadata.data.keys()
+        self.assertFalse(missing, f"missing keys: {missing}")
 
     def test_content_type_structure(self):
         """Test content type structure"""
@@ -170,16 +226,16 @@ class TestMetadata(unittest.TestCase):
 
     def test_product_structure(self):
         """Test product structure"""
+        required_fields = {
+            "name",
+            "prevent_duplicates",
+            "min_occurrences",
+            "current_count",  # Add new required field
+        }
         for content_type, products in self.metadata.data["products"].items():
             for product in products:
-                required_fields = [
-                    "name", 
-                    "prevent_duplicates", 
-                    "min_occurrences",
-                    "current_count"  # Add new required field
-                ]
-                for field in required_fields:
-                    self.assertIn(field, product)
+                missing = required_fields - product.keys()
+                self.assertFalse(missing, f"{content_type} product missing fields: {missing}")
                 
                 # Also validate the type and initial value
                 self.assertIsInstance(product["current_count"], int)
@@ -189,7 +245,7 @@ class TestMetadata(unittest.TestCase):
 class TestMetadataEditor(unittest.TestCase):
     def setUp(self):
         """Create fresh editor instance with test data"""
-        self.test_data = copy.deepcopy(EXAMPLE_METADATA)
+        self.test_data = json_clone(EXAMPLE_METADATA)
         self.editor = MetadataEditor(self.test_data)
 
     def mock_exists_fn(self, path):
@@ -211,7 +267,7 @@ class TestMetadataEditor(unittest.TestCase):
         image_data = self.test_data["images"][image_name]
         self.assertEqual(image_data["product"], "magnesium")
         self.assertEqual(image_data["settings_source"], "custom")
-        self.assertEqual(image_data["settings"], {"test": "value"})
+        self.assertDictEqual(image_data["settings"], {"test": "value"})
 
     def test_edit_image_invalid(self):
         """Test editing nonexistent image"""
@@ -229,12 +285,9 @@ class TestMetadataEditor(unittest.TestCase):
         self.editor.edit_image(image_name, {"product": "supplement"})
 
         # Check counts updated correctly
-        hook_products = self.test_data["products"]["hook"]
-        for product in hook_products:
-            if product["name"] == "magnesium":
-                self.assertEqual(product.get("current_count", 0), 0)
-            elif product["name"] == "supplement":
-                self.assertEqual(product.get("current_count", 0), 1)
+        products_by_name = {p["name"]: p for p in self.test_data["products"]["hook"]}
+        self.assertEqual(products_by_name["magnesium"].get("current_count", 0), 0)
+        self.assertEqual(products_by_name["supplement"].get("current_count", 0), 1)
 
     def test_edit_image_untagged_status(self):
         """Test untagged list updates when editing image"""
@@ -250,36 +303,31 @@ class TestMetadataEditor(unittest.TestCase):
 
     def test_edit_settings_content_type(self):
         """Test editing content type settings"""
-        test_settings = {
-            "base_settings": {"default_text_type": "plain"},
-            "text_settings": {"plain": {"font_size": 80}},
-        }
+        test_settings = _EDITED_SETTINGS
 
         self.editor.edit_settings("content_type", "hook", test_settings)
 
         # Verify settings updated
-        self.assertEqual(self.test_data["settings"]["hook"]["content"], test_settings)
+        self.assertDictEqual(self.test_data["settings"]["hook"]["content"], test_settings)
 
     def test_edit_settings_custom(self):
         """Test editing custom image settings"""
         image_name = "1h.PNG"
-        test_settings = {
-            "base_settings": {"default_text_type": "plain"},
-            "text_settings": {"plain": {"font_size": 80}},
-        }
+        test_settings = _EDITED_SETTINGS
 
         self.editor.edit_settings("custom", image_name, test_settings)
 
         # Verify settings updated
-        self.assertEqual(
+        self.assertDictEqual(
             self.test_data["images"][image_name]["settings"], test_settings
         )
         self.assertEqual(
             self.test_data["images"][image_name]["settings_source"], "custom"
         )
 
+    @patch(_PIL_IMAGE_OPEN)
     @patch("content_manager.metadata.metadata_editor.Path")
-    def test_move_untagged_image(self, MockPath):
+    def test_move_untagged_image(self, MockPath, mock_open):
         """Test moving image between content types"""
         image_name = "test.png"
         base_path = "/fake/base/path"
@@ -309,11 +357,10 @@ class TestMetadataEditor(unittest.TestCase):
         )
 
         # Mock PIL.Image.open
-        with patch("PIL.Image.open") as mock_open:
-            mock_open.return_value.__enter__.return_value.size = (1080, 1920)
+        _mock_pil_image(mock_open, (1080, 1920))
 
-            # Move image
-            self.editor.move_untagged_image(image_name, "hook")
+        # Move image
+        self.editor.move_untagged_image(image_name, "hook")
 
         # Verify metadata updated
         self.assertNotIn(image_name, self.test_data["untagged"])
@@ -337,156 +384,157 @@ class TestMetadataEditor(unittest.TestCase):
     def test_update_product_count(self):
         """Test product count updates"""
         self.editor._update_product_count("hook", "magnesium", increment=True)
-        product = next(
-            p for p in self.test_data["products"]["hook"] if p["name"] == "magnesium"
-        )
-        self.assertEqual(product.get("current_count", 0), 1)
+        products_by_name = {p["name"]: p for p in self.test_data["products"]["hook"]}
+        self.assertEqual(products_by_name["magnesium"].get("current_count", 0), 1)
 
 
 class TestMetadataGenerator(unittest.TestCase):
-    def setUp(self):
-        """Setup test data and paths"""
-        self.content_types = ["hook", "content", "cta"]
-        self.products = {
+    @classmethod
+    def setUpClass(cls):
+        """Start the CaptionsHelper patcher and build the shared inputs once
+
+        The generator only reads content_types and products, so every test
+        can pass the same objects.
+        """
+        cls.captions_patcher = patch(
+            "content_manager.metadata.metadata_generator.CaptionsHelper"
+        )
+        cls.mock_captions = cls.captions_patcher.start()
+
+        cls.content_types = ["hook", "content", "cta"]
+        cls.products = {
             "hook": ["magnesium", "all", "supplement"],
             "content": ["magnesium", "vitamin_c", "all"],
             "cta": ["shop_now", "learn_more", "all"],
         }
 
-        # Mock CaptionsHelper
-        self.captions_patcher = patch(
-            "content_manager.metadata.metadata_generator.CaptionsHelper"
-        )
-        self.mock_captions = self.captions_patcher.start()
+    @classmethod
+    def tearDownClass(cls):
+        cls.captions_patcher.stop()
+
+    def setUp(self):
+        """Reset the CaptionsHelper mock"""
+        self.mock_captions.reset_mock()
         self.mock_captions.get_product_min_occurrences.return_value = {
             "hook": [{"name": "magnesium", "min_occurrences": 1}],
             "content": [{"name": "vitamin_c", "min_occurrences": 2}],
             "cta": [{"name": "shop_now", "min_occurrences": 1}],
         }
 
-    def tearDown(self):
-        self.captions_patcher.stop()
-
-    def test_generate_basic_structure(self):
+    def _make_base_mock(self, iterdir_return=(), **kwargs) -> MagicMock:
+        """Mock an existing base directory whose iterdir() lists iterdir_return"""
+        mock_base = MagicMock(**kwargs)
+        mock_base.iterdir.return_value = list(iterdir_return)
+        mock_base.exists.return_value = True
+        return mock_base
+
+    def _make_content_mock(self, glob_return=(), **kwargs) -> MagicMock:
+        """Mock an existing content directory whose glob() finds glob_return"""
+        mock_content = MagicMock(**kwargs)
+        mock_content.glob.return_value = list(glob_return)
+        mock_content.exists.return_value = True
+        return mock_content
+
+    @staticmethod
+    def _path_side_effect(paths: dict, default: MagicMock):
+        """Map Path(...) calls to prebuilt mocks by path, falling back to default"""
+        return lambda path, *args: paths.get(str(path), default)
+
+    @patch("pathlib.Path")
+    def test_generate_basic_structure(self, MockPath):
         """Test basic metadata structure generation"""
-        with patch("pathlib.Path") as MockPath:
-            # Setup mock path
-            mock_base = MagicMock()
-            mock_base.iterdir.return_value = []  # No untagged images
-            mock_base.exists.return_value = True
-
-            def mock_path_init(path):
-                if str(path).endswith("base/path"):
-                    return mock_base
-                mock_content = MagicMock()
-                mock_content.glob.return_value = [
-                    MagicMock(name="test1.png", spec=Path),
-                    MagicMock(name="test2.PNG", spec=Path),
-                ]
-                mock_content.exists.return_value = True
-                return mock_content
+        # Setup mock paths
+        mock_base = self._make_base_mock()  # No untagged images
+        mock_content = self._make_content_mock([
+            MagicMock(name="test1.png", spec=_PATH_SPEC),
+            MagicMock(name="test2.PNG", spec=_PATH_SPEC),
+        ])
+        MockPath.side_effect = self._path_side_effect({"/base/path": mock_base}, mock_content)
+
+        # Create generator AFTER mocking Path
+        generator = MetadataGenerator(
+            MockPath("/base/path"), self.content_types, self.products
+        )
+        metadata = generator.generate()
+
+        # Verify structure
+        self.assertIn("content_types", metadata)
+        self.assertIn("products", metadata)
+        self.assertIn("structure", metadata)
+        self.assertIn("images", metadata)
+        self.assertIn("untagged", metadata)
+        self.assertIn("settings", metadata)
+
+    @patch("pathlib.Path")
+    def test_generate_settings_structure(self, MockPath):
+        """Test settings hierarchy generation"""
+        # Setup mock paths
+        mock_base = self._make_base_mock()
+        mock_content = self._make_content_mock()
+        MockPath.side_effect = self._path_side_effect({"/base/path": mock_base}, mock_content)
+
+        # Create generator AFTER mocking
+        generator = MetadataGenerator(
+            MockPath("/base/path"), self.content_types, self.products
+        )
+        metadata = generator.generate()
 
-            MockPath.side_effect = mock_path_init
+        # Verify settings
+        self.assertIn("settings", metadata)
+        self.assertIn("hook", metadata["settings"])
+        hook_settings = metadata["settings"]["hook"]
+        self.assertIn("content", hook_settings)
 
-            # Create generator AFTER mocking Path
-            generator = MetadataGenerator(
-                MockPath("/base/path"), self.content_types, self.products
-            )
-            metadata = generator.generate()
+    def test_generate_phases(self):
+        """Test content types, products, structure and settings generation in order"""
+        # CaptionsHelper is already patched for the class
+        self.mock_captions.get_product_min_occurrences.return_value = {}
 
-            # Verify structure
-            self.assertIn("content_types", metadata)
-            self.assertIn("products", metadata)
-            self.assertIn("structure", metadata)
-            self.assertIn("images", metadata)
-            self.assertIn("untagged", metadata)
-            self.assertIn("settings", metadata)
+        # Mock a content directory with one image
+        mock_image = MagicMock(spec=_PATH_SPEC)
+        mock_image.name = "test.png"
+        mock_content_dir = self._make_content_mock([mock_image], spec=_PATH_SPEC)
 
-    def test_generate_settings_structure(self):
-        """Test settings hierarchy generation"""
-        with patch("pathlib.Path") as MockPath:
-            # Setup mock paths
-            mock_base = MagicMock()
-            mock_base.iterdir.return_value = []
-            mock_base.exists.return_value = True
-
-            def mock_path_init(path):
-                if str(path).endswith("base/path"):
-                    return mock_base
-                mock_content = MagicMock()
-                mock_content.glob.return_value = []
-                mock_content.exists.return_value = True
-                return mock_content
-
-            MockPath.side_effect = mock_path_init
-
-            # Create generator AFTER mocking
-            generator = MetadataGenerator(
-                MockPath("/base/path"), self.content_types, self.products
-            )
-            metadata = generator.generate()
+        # Mock base directory
+        mock_base = self._make_base_mock(spec=_PATH_SPEC)
+        mock_base.__truediv__.return_value = mock_content_dir
 
-            # Verify settings
-            self.assertIn("settings", metadata)
-            self.assertIn("hook", metadata["settings"])
-            hook_settings = metadata["settings"]["hook"]
-            self.assertIn("content", hook_settings)
+        products = {"hook": ["product1", "product2"], "content": ["product3"]}
+        generator = MetadataGenerator(mock_base, ["hook", "content"], products)
 
-    def test_generate_content_types(self):
-        """Test ONLY content types generation"""
-        generator = MetadataGenerator(Path("/fake"), ["hook", "content"], {})
+        # Content types
         generator._generate_content_types()
-
         self.assertEqual(generator.metadata["content_types"], ["hook", "content"])
 
-    def test_generate_products(self):
-        """Test ONLY products generation"""
-        with patch(
-            "content_manager.metadata.metadata_generator.CaptionsHelper"
-        ) as mock_captions:
-            mock_captions.get_product_min_occurrences.return_value = {}
-
-            products = {"hook": ["product1", "product2"]}
-            generator = MetadataGenerator(Path("/fake"), ["hook"], products)
-            generator._generate_products()
-
-            self.assertIn("hook", generator.metadata["products"])
-            hook_products = generator.metadata["products"]["hook"]
-            self.assertEqual(len(hook_products), 2)
-            self.assertEqual(hook_products[0]["name"], "product1")
-
-    def test_generate_structure(self):
-        """Test ONLY structure generation"""
-        with patch("pathlib.Path") as MockPath:
-            # Mock a directory with one image
-            mock_image = MagicMock(spec=Path)
-            mock_image.name = "test.png"
-
-            # Mock the hook directory
-            mock_hook_dir = MagicMock(spec=Path)
-            mock_hook_dir.glob.return_value = [mock_image]
-            mock_hook_dir.exists.return_value = True
-
-            # Mock base directory
-            mock_base = MagicMock(spec=Path)
-            mock_base.exists.return_value = True
-            mock_base.__truediv__.return_value = mock_hook_dir
-
-            # Handle Path creation
-            def mock_path_init(*args):
-                if isinstance(args[0], str) and args[0] == "/fake":
-                    return mock_base
-                return mock_hook_dir
-
-            MockPath.side_effect = mock_path_init
-
-            # Create generator with mocked Path
-            generator = MetadataGenerator(MockPath("/fake"), ["hook"], {})
-            generator._generate_structure()
-
-            # Verify structure was created correctly
-            self.assertIn("hook", generator.metadata["structure"])
-            self.assertIn("test.png", generator.metadata["structure"]["hook"]["images"])
+        # Products
+        generator._generate_products()
+        self.assertIn("hook", generator.metadata["products"])
+        hook_products = generator.metadata["products"]["hook"]
+        self.assertEqual(len(hook_products), 2)
+        self.assertEqual(hook_products[0]["name"], "product1")
+
+        # Structure
+        generator._generate_structure()
+        self.assertIn("hook", generator.metadata["structure"])
+        self.assertIn("test.png", generator.metadata["structure"]["hook"]["images"])
+
+        # Settings, built from the generated products
+        generator._generate_settings()
+        self.assertIn("settings", generator.metadata)
+
+        # Check hook content type
+        self.assertIn("hook", generator.metadata["settings"])
+        hook_settings = generator.metadata["settings"]["hook"]
+        self.assertIsNone(hook_settings["content"])
+        self.assertIn("[product1, product2]", hook_settings)
+        self.assertIsNone(hook_settings["[product1, product2]"])
+
+        # Check content content type
+        self.assertIn("content", generator.metadata["settings"])
+        content_settings = generator.metadata["settings"]["content"]
+        self.assertIsNone(content_settings["content"])
+        self.assertIn("[product3]", content_settings)
+        self.assertIsNone(content_settings["[product3]"])
 
     def test_generate_images(self):
         """Test ONLY image metadata generation"""
@@ -525,91 +573,56 @@ class TestMetadataGenerator(unittest.TestCase):
                 {"width": 1920, "height": 1080},
             )
 
-    def test_generate_untagged(self):
+    @patch("pathlib.Path")
+    def test_generate_untagged(self, MockPath):
         """Test untagged images detection"""
-        with patch("pathlib.Path") as MockPath:
-            # Create mock base_path
-            mock_base_path = MagicMock()
-            mock_base_path.iterdir.return_value = []
-            MockPath.return_value = mock_base_path
-
-            generator = MetadataGenerator("/fake/path", ["hook"], {})
-            generator.base_path = mock_base_path
-
-            # Create mock files
-            def create_mock_file(filename, suffix):
-                mock = MagicMock()
-                mock.name = filename
-                mock.is_file.return_value = True
-                mock.suffix = suffix
-                return mock
-
-            mock_files = [
-                create_mock_file("test1.png", ".png"),
-                create_mock_file("test2.jpg", ".jpg"),
-                create_mock_file("test3.txt", ".txt"),
-                create_mock_file(".hidden.png", ".png"),
-            ]
-
-            mock_base_path.iterdir.return_value = mock_files
-
-            generator.metadata = {"structure": {"hook": {"images": ["test1.png"]}}}
-
-            generator._generate_untagged()
-
-            # Verify results
-            self.assertIn("untagged", generator.metadata)
-            self.assertIn("test2.jpg", generator.metadata["untagged"])
-            self.assertNotIn("test1.png", generator.metadata["untagged"])
-            self.assertNotIn("test3.txt", generator.metadata["untagged"])
-            self.assertNotIn(".hidden.png", generator.metadata["untagged"])
-
-    def test_generate_settings(self):
-        """Test settings hierarchy generation"""
-        # Create generator
-        generator = MetadataGenerator("/fake/path", ["hook", "content"], {})
+        # Create mock base_path
+        mock_base_path = MagicMock()
+        mock_base_path.iterdir.return_value = []
+        MockPath.return_value = mock_base_path
 
-        # Setup initial metadata
-        generator.metadata = {
-            "products": {
-                "hook": [{"name": "product1"}, {"name": "product2"}],
-                "content": [{"name": "product3"}],
-            }
-        }
+        generator = MetadataGenerator("/fake/path", ["hook"], {})
+        generator.base_path = mock_base_path
+
+        # Create mock files
+        def create_mock_file(filename, suffix):
+            mock = MagicMock()
+            mock.name = filename
+            mock.is_file.return_value = True
+            mock.suffix = suffix
+            return mock
+
+        mock_files = [
+            create_mock_file("test1.png", ".png"),
+            create_mock_file("test2.jpg", ".jpg"),
+            create_mock_file("test3.txt", ".txt"),
+            create_mock_file(".hidden.png", ".png"),
+        ]
 
-        # Generate settings
-        generator._generate_settings()
+        mock_base_path.iterdir.return_value = mock_files
 
-        # Verify
-        self.assertIn("settings", generator.metadata)
+        generator.metadata = {"structure": {"hook": {"images": ["test1.png"]}}}
 
-        # Check hook content type
-        self.assertIn("hook", generator.metadata["settings"])
-        hook_settings = generator.metadata["settings"]["hook"]
-        self.assertIsNone(hook_settings["content"])
-        self.assertIn("[product1, product2]", hook_settings)
-        self.assertIsNone(hook_settings["[product1, product2]"])
+        generator._generate_untagged()
 
-        # Check content content type
-        self.assertIn("content", generator.metadata["settings"])
-        content_settings = generator.metadata["settings"]["content"]
-        self.assertIsNone(content_settings["content"])
-        self.assertIn("[product3]", content_settings)
-        self.assertIsNone(content_settings["[product3]"])
+        # Verify results
+        self.assertIn("untagged", generator.metadata)
+        self.assertIn("test2.jpg", generator.metadata["untagged"])
+        self.assertNotIn("test1.png", generator.metadata["untagged"])
+        self.assertNotIn("test3.txt", generator.metadata["untagged"])
+        self.assertNotIn(".hidden.png", generator.metadata["untagged"])
 
-    def test_get_image_dimensions(self):
+    @patch(_PIL_IMAGE_OPEN)
+    def test_get_image_dimensions(self, mock_open):
         """Test getting image dimensions"""
         generator = MetadataGenerator("/fake/path", ["hook"], {})
-        mock_image = MagicMock()
-        mock_image.size = (1920, 1080)
+        _mock_pil_image(mock_open)
 
-        with patch("PIL.Image.open") as mock_open:
-            mock_open.return_value.__enter__.return_value = mock_image
-            mock_path = MagicMock()
-            dimensions = generator._get_image_dimensions(mock_path)
+        mock_path = MagicMock()
+        dimensions = generator._get_image_dimensions(mock_path)
 
-            self.assertEqual(dimensions, {"width": 1920, "height": 1080})
-            mock_open.assert_called_once_with(mock_path)
+        self.assertDictEqual(dimensions, {"width": 1920, "height": 1080})
+        mock_open.assert_called_once_with(mock_path)
 
     def test_generate_image_metadata(self):
         """Test generating metadata for a single image"""
@@ -629,39 +642,53 @@ class TestMetadataGenerator(unittest.TestCase):
             "settings": None,
         }
 
-        self.assertEqual(metadata, expected_metadata)
+        self.assertDictEqual(metadata, expected_metadata)
         generator._get_image_dimensions.assert_called_once_with(mock_path)
 
 
 class TestMetadataValidator(unittest.TestCase):
-    def setUp(self):
-        """Create fresh validator instance"""
-        self.base_path = Path("/fake/path")
-        self.validator = MetadataValidator(base_path=self.base_path)
+    @classmethod
+    def setUpClass(cls):
+        """Start the patchers and build the validator once
 
+        setUp resets the validator and the mocks per test.
+        """
         # Mock CaptionsHelper
-        self.captions_patcher = patch(
+        cls.captions_patcher = patch(
             "content_manager.metadata.metadata_validator.CaptionsHelper"
         )
-        self.mock_captions = self.captions_patcher.start()
-        self.mock_captions.get_product_min_occurrences.return_value = {"product1": 1}
+        cls.mock_captions = cls.captions_patcher.start()
 
         # Mock Path.exists
-        self.path_exists_patcher = patch("pathlib.Path.exists")
-        self.mock_exists = self.path_exists_patcher.start()
-        self.mock_exists.return_value = True
+        cls.path_exists_patcher = patch("pathlib.Path.exists")
+        cls.mock_exists = cls.path_exists_patcher.start()
 
         # Mock PIL Image
-        self.pil_patcher = patch("PIL.Image.open")
-        self.mock_pil = self.pil_patcher.start()
-        mock_image = MagicMock()
-        mock_image.size = (1920, 1080)
-        self.mock_pil.return_value.__enter__.return_value = mock_image
+        cls.pil_patcher = patch(_PIL_IMAGE_OPEN)
+        cls.mock_pil = cls.pil_patcher.start()
+
+        cls.base_path = _FAKE_BASE
+        cls.validator = MetadataValidator(base_path=cls.base_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.captions_patcher.stop()
+        cls.path_exists_patcher.stop()
+        cls.pil_patcher.stop()
+
+    def setUp(self):
+        """Reset the shared validator and the mocks"""
+        self.validator.reset()
+        self.validator.strict = True  # some tests switch to lenient mode
+
+        self.mock_captions.reset_mock()
+        self.mock_captions.get_product_min_occurrences.return_value = {"product1": 1}
+
+        self.mock_exists.reset_mock()
+        self.mock_exists.return_value = True
 
-    def tearDown(self):
-        self.captions_patcher.stop()
-        self.path_exists_patcher.stop()
-        self.pil_patcher.stop()
+        self.mock_pil.reset_mock()
+        _mock_pil_image(self.mock_pil)
 
     def test_validate_key_order(self):
         """Test that metadata keys must be in correct order"""
@@ -683,30 +710,23 @@ class TestMetadataValidator(unittest.TestCase):
 
     def test_validate_content_types(self):
         """Test content_types validation"""
-        data = copy.deepcopy(EXAMPLE_METADATA)
-
-        # Test invalid type
-        data["content_types"] = "not a list"
-        result = self.validator._validate_content_types(data, ["hook"])
-        self.assertFalse(result)
-        self.assertIn("content_types must be a list", self.validator.errors)
-
-        # Clear errors for next test
-        self.validator.errors = []
-
-        # Test mismatch
-        data["content_types"] = ["hook", "extra"]
-        result = self.validator._validate_content_types(data, ["hook"])
-        self.assertFalse(result)
-        self.assertIn("Content types mismatch", self.validator.errors[0])
-
-        # Clear errors for next test
-        self.validator.errors = []
+        data = json_clone(EXAMPLE_METADATA)
 
-        # Test correct
-        data["content_types"] = ["hook"]
-        result = self.validator._validate_content_types(data, ["hook"])
-        self.assertTrue(result)
+        # (case, content_types, expected result, expected first error)
+        cases = (
+            ("invalid_type", "not a list", False, "content_types must be a list"),
+            ("mismatch", ["hook", "extra"], False, "Content types mismatch"),
+            ("correct", ["hook"], True, None),
+        )
+        for case, content_types, expected, error in cases:
+            with self.subTest(case=case):
+                # Reset so each case starts with no errors
+                self.validator.reset()
+                data["content_types"] = content_types
+                result = self.validator._validate_content_types(data, ["hook"])
+                self.assertEqual(result, expected)
+                if error is not None:
+                    self.assertIn(error, self.validator.errors[0])
 
     def test_validate_strict_mode(self):
         """Test strict mode behavior with warnings"""
@@ -791,14 +811,13 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         self.validator.strict = False
-        self.validator.seen_warnings = set()  # Clear any existing warnings
         result = self.validator.validate(data, ["hook"], {"hook": ["product1"]})
         self.assertTrue(result)
 
         # Verify we get one warning per image (this is the correct behavior)
         expected_warnings = {
-            f"Image test1.png has no product assigned. Valid products: ['all', {['product1']}]",
-            f"Image test2.png has no product assigned. Valid products: ['all', {['product1']}]"
+            f"Image test1.png has no product assigned. Valid products: {_EXPECTED_PRODUCTS_STR}",
+            f"Image test2.png has no product assigned. Valid products: {_EXPECTED_PRODUCTS_STR}"
         }
         actual_warnings = set(self.validator.warnings)
 
@@ -846,7 +865,6 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         self.validator.strict = False
-        self.validator.seen_warnings = set()  # Clear any existing warnings
 
         # First validation
         result = self.validator.validate(data, ["hook"], {"hook": ["product1"]})
@@ -862,7 +880,7 @@ class TestMetadataValidator(unittest.TestCase):
         self.assertEqual(len(self.validator.warnings), 1)  # One warning for one image
         self.assertEqual(
             self.validator.warnings[0],
-            f"Image test1.png has no product assigned. Valid products: ['all', {['product1']}]"
+            f"Image test1.png has no product assigned. Valid products: {_EXPECTED_PRODUCTS_STR}"
         )
 
     def test_validation_error_clearing(self):
@@ -882,6 +900,8 @@ class TestMetadataValidator(unittest.TestCase):
         )
         self.assertFalse(result)
         self.assertTrue(len(self.validator.errors) > 0)
+        # Each error is reported once
+        self.assertEqual(len(set(self.validator.errors)), len(self.validator.errors))
         first_errors = self.validator.errors.copy()
 
         # Second validation with correct data
@@ -931,14 +951,14 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test invalid products type
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data)
         invalid_data["products"] = []
         result = self.validator._validate_products(invalid_data, {"hook": ["product1"]})
         self.assertFalse(result)
         self.assertIn("products must be a dictionary", self.validator.errors)
 
         # Test missing required product fields
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "products", "hook")
         invalid_data["products"]["hook"][0] = {"name": "product1"}  # Missing fields
         result = self.validator._validate_products(invalid_data, {"hook": ["product1"]})
         self.assertFalse(result)
@@ -956,7 +976,7 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test missing path
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "structure", "hook")
         del invalid_data["structure"]["hook"]["path"]
         result = self.validator._validate_structure(invalid_data)
         self.assertFalse(result)
@@ -968,6 +988,28 @@ class TestMetadataValidator(unittest.TestCase):
         self.assertFalse(result)
         self.assertIn("does not exist", str(self.validator.errors))
 
+    def test_image_size_cached_per_file_version(self):
+        """Unchanged images are measured once; changed ones are re-measured"""
+        metadata_validator._cached_image_size.cache_clear()
+        fd, name = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        img_path = Path(name)
+        try:
+            img_path.write_bytes(b"first")
+            self.assertEqual(metadata_validator._image_size(img_path), (1920, 1080))
+            self.assertEqual(metadata_validator._image_size(img_path), (1920, 1080))
+            self.assertEqual(self.mock_pil.call_count, 1)
+
+            # New size and mtime make a new file version
+            img_path.write_bytes(b"second version")
+            os.utime(img_path, ns=(0, 0))
+            _mock_pil_image(self.mock_pil, (1000, 500))
+            self.assertEqual(metadata_validator._image_size(img_path), (1000, 500))
+            self.assertEqual(self.mock_pil.call_count, 2)
+        finally:
+            img_path.unlink()
+            metadata_validator._cached_image_size.cache_clear()
+
     def test_validate_image_dimensions(self):
         """Test image dimension validation"""
         data = {
@@ -988,7 +1030,7 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test missing dimensions field entirely
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "images", "test1.png")
         del invalid_data["images"]["test1.png"]["dimensions"]
         result = self.validator._validate_images(invalid_data)
         self.assertFalse(result)
@@ -1000,7 +1042,7 @@ class TestMetadataValidator(unittest.TestCase):
         self.validator.errors.clear()
 
         # Test dimensions as empty dict
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "images", "test1.png")
         invalid_data["images"]["test1.png"]["dimensions"] = {}
         result = self.validator._validate_images(invalid_data)
         self.assertFalse(result)
@@ -1010,9 +1052,7 @@ class TestMetadataValidator(unittest.TestCase):
         self.validator.errors.clear()
 
         # Test dimension mismatch with actual image
-        mock_image = MagicMock()
-        mock_image.size = (1000, 500)  # Different from metadata
-        self.mock_pil.return_value.__enter__.return_value = mock_image
+        _mock_pil_image(self.mock_pil, (1000, 500))  # Different from metadata
 
         result = self.validator._validate_images(data)
         self.assertFalse(result)
@@ -1038,14 +1078,14 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test invalid content type
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "images", "test1.png")
         invalid_data["images"]["test1.png"]["content_type"] = "invalid"
         result = self.validator._validate_images(invalid_data)
         self.assertFalse(result)
         self.assertIn("has invalid content_type: invalid", str(self.validator.errors))
 
         # Test image not in content type folder
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "structure", "hook")
         invalid_data["structure"]["hook"]["images"] = []  # Remove image from structure
         result = self.validator._validate_images(invalid_data)
         self.assertFalse(result)
@@ -1116,16 +1156,19 @@ class TestMetadataValidator(unittest.TestCase):
             "settings",
         ]
 
-        # Test each required field
+        # Test each required field against the image minus that field
+        image = data["images"]["test1.png"]
         for field in required_fields:
-            invalid_data = copy.deepcopy(data)
-            del invalid_data["images"]["test1.png"][field]
-            result = self.validator._validate_images(invalid_data)
-            self.assertFalse(result)
-            self.assertIn(
-                f"Image test1.png missing required field: {field}",
-                self.validator.errors,
-            )
+            with self.subTest(field=field):
+                self.validator.reset()
+                invalid_image = {k: v for k, v in image.items() if k != field}
+                invalid_data = {**data, "images": {"test1.png": invalid_image}}
+                result = self.validator._validate_images(invalid_data)
+                self.assertFalse(result)
+                self.assertIn(
+                    f"Image test1.png missing required field: {field}",
+                    self.validator.errors,
+                )
 
     def test_validate_settings_sources(self):
         """Test settings source validation"""
@@ -1180,19 +1223,50 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test invalid settings type
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data)
         invalid_data["settings"] = []
         result = self.validator._validate_settings(invalid_data)
         self.assertFalse(result)
         self.assertIn("settings must be a dictionary", self.validator.errors)
 
         # Test invalid product group format
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "settings", "hook")
         invalid_data["settings"]["hook"]["product1"] = None  # Missing brackets
         result = self.validator._validate_settings(invalid_data)
         self.assertFalse(result)
         self.assertIn("Invalid product group format", str(self.validator.errors))
 
+    def test_validate_settings_block_shared(self):
+        """A settings block shared by several slots is validated once per run"""
+        block = {"base_settings": {"default_text_type": "plain"}}
+        with patch.object(
+            self.validator.settings_validator, "validate_settings", return_value=True
+        ) as mock_validate:
+            # The same block referenced from three slots
+            for _ in range(3):
+                self.assertTrue(self.validator._validate_settings_block(block))
+            self.assertEqual(mock_validate.call_count, 1)
+
+            # An equal but separate block is validated on its own
+            self.assertTrue(self.validator._validate_settings_block(dict(block)))
+            self.assertEqual(mock_validate.call_count, 2)
+
+            # A new run validates the block again
+            self.validator.reset()
+            self.assertTrue(self.validator._validate_settings_block(block))
+            self.assertEqual(mock_validate.call_count, 3)
+
+    def test_validate_settings_block_shared_invalid(self):
+        """An invalid shared block fails for every slot referencing it"""
+        block = {"base_settings": {}}
+        with patch.object(
+            self.validator.settings_validator, "validate_settings", return_value=False
+        ) as mock_validate:
+            for _ in range(2):
+                self.assertFalse(self.validator._validate_settings_block(block))
+            # Failures are not cached, so each slot gets its own errors
+            self.assertEqual(mock_validate.call_count, 2)
+
     def test_validate_untagged_images(self):
         """Test untagged images validation"""
         data = {
@@ -1332,7 +1406,7 @@ class TestMetadataValidator(unittest.TestCase):
         }
 
         # Test overlapping product groups
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "settings", "hook")
         invalid_data["settings"]["hook"]["[product1,product2]"] = None
         invalid_data["settings"]["hook"]["[product2]"] = None
         result = self.validator._validate_settings(invalid_data)
@@ -1340,7 +1414,7 @@ class TestMetadataValidator(unittest.TestCase):
         self.assertIn("Duplicate products in hook settings", str(self.validator.errors))
 
         # Test invalid product in group
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data, "settings", "hook")
         invalid_data["settings"]["hook"]["[invalid_product]"] = None
         result = self.validator._validate_settings(invalid_data)
         self.assertFalse(result)
@@ -1398,7 +1472,7 @@ class TestMetadataValidator(unittest.TestCase):
         self.assertIn("Product content types mismatch", str(self.validator.errors))
 
         # Test settings content type consistency
-        invalid_data = copy.deepcopy(data)
+        invalid_data = _clone_for_mutation(data)
         invalid_data["products"] = {"hook": []}
         invalid_data["settings"] = {"invalid": {"content": None}}
         result = self.validator._validate_settings(invalid_data)
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock
 from config.logging import logger  # Import the pre-configured logger
 from content_manager.settings.settings_constants import VALID_TEXT_TYPES
 from content_manager.settings.settings_handler import Settings
-from tests.test_utils import DEFAULT_SETTINGS
+from tests.test_utils import DEFAULT_SETTINGS, json_clone
 
 """Tests for settings validation of complete settings dictionaries.
 
@@ -44,7 +44,7 @@ class TestSettingsHandler(unittest.TestCase):
     def setUp(self):
         """Create fresh instance and state for EACH test."""
         self.settings = Settings(test_mode=True)  # Use test mode!
-        self.original_settings = copy.deepcopy(DEFAULT_SETTINGS)
+        self.original_settings = json_clone(DEFAULT_SETTINGS)
         self.created_files = []  # Track what we create
         # Create test directories
         self.templates_dir = Path("assets/test_templates")
@@ -178,7 +178,7 @@ class TestSettingsHandler(unittest.TestCase):
         """Test loading template with invalid field values."""
         test_template = "default"
         # Start with default but modify one value to be invalid
-        invalid_settings = DEFAULT_SETTINGS.copy()
+        invalid_settings = json_clone(DEFAULT_SETTINGS)
         invalid_settings["text_settings"]["plain"]["font_size"] = "not_a_number"
 
         with open(self.templates_dir / f"{test_template}.json", "w") as f:
@@ -200,6 +200,17 @@ class TestSettingsHandler(unittest.TestCase):
             self.settings.load_template(test_template)
         self.assertTrue(f"Invalid JSON in template default:" in str(cm.exception))
 
+    def test_load_template_cached(self):
+        """Test repeated loads skip validation and return independent copies."""
+        first = self.settings.load_template()
+        first["text_settings"]["plain"]["font_size"] = 1
+
+        self.settings.settings_validator = MagicMock()
+        second = self.settings.load_template()
+
+        self.settings.settings_validator.validate_settings.assert_not_called()
+        self.assertEqual(second, DEFAULT_SETTINGS)
+
     # 3. list_fonts()
     def test_list_fonts_empty(self):
         """Test listing fonts when directory is empty."""
@@ -460,7 +471,7 @@ class TestModifySettings(unittest.TestCase):
     # 5. modify_base_settings()
     def test_modify_base_settings_to_highlight(self):
         """Test changing base settings to highlight type."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         modified = self.settings.modify_base_settings(
             settings=settings, default_text_type="highlight"
         )
@@ -469,7 +480,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_base_settings_to_plain(self):
         """Test changing base settings to plain type."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         modified = self.settings.modify_base_settings(
             settings=settings, default_text_type="plain"
         )
@@ -478,7 +489,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_base_settings_invalid_type(self):
         """Test invalid text type raises error."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         invalid_type = "invalid_type"
         with self.assertRaises(ValueError) as context:
             self.settings.modify_base_settings(
@@ -491,13 +502,13 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_base_settings_no_changes(self):
         """Test no changes returns same settings."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         modified = self.settings.modify_base_settings(settings=settings)
         self.assertEqual(modified, settings)
 
     def test_modify_base_settings_preserves_other_settings(self):
         """Test that other settings are preserved when changing text type."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         original_text_settings = copy.deepcopy(settings["text_settings"])
 
         modified = self.settings.modify_base_settings(
@@ -510,7 +521,7 @@ class TestModifySettings(unittest.TestCase):
     # 6. modify_settings()
     def test_modify_settings_single_parameter(self):
         """Test modifying a single parameter (font size)."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         original_font_size = int(
             settings["text_settings"]["plain"]["font_size"]
         )  # Convert to int
@@ -523,7 +534,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_multiple_parameters(self):
         """Test modifying multiple parameters together."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         font_path = DEFAULT_SETTINGS["text_settings"]["plain"]["font"]
         original_font_size = settings["text_settings"]["plain"]["font_size"]
         new_font_size = original_font_size + 10
@@ -541,7 +552,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_colors(self):
         """Test color modifications."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Test invalid color
         result = self.settings.modify_settings(
@@ -577,7 +588,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_positions_tuple(self):
         """Test position modifications using tuple format."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Full position tuple
         modified = self.settings.modify_settings(
@@ -613,7 +624,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_positions_individual(self):
         """Test position modifications using individual parameters."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Individual position changes
         modified = self.settings.modify_settings(
@@ -629,9 +640,52 @@ class TestModifySettings(unittest.TestCase):
             modified["text_settings"]["plain"]["position"]["horizontal_jitter"], 0.03
         )
 
+    def test_modify_settings_single_position_param(self):
+        """Test each individual position parameter updates only its own key."""
+        cases = (
+            ("vertical_position", "vertical", [0.55, 0.65]),
+            ("horizontal_position", "horizontal", [0.3, 0.7]),
+            ("vertical_jitter", "vertical_jitter", 0.04),
+            ("horizontal_jitter", "horizontal_jitter", 0.05),
+        )
+        original = DEFAULT_SETTINGS["text_settings"]["plain"]["position"]
+        for param, key, value in cases:
+            with self.subTest(param=param):
+                modified = self.settings.modify_settings(
+                    settings=json_clone(DEFAULT_SETTINGS),
+                    text_type="plain",
+                    **{param: value},
+                )
+                self.assertEqual(
+                    modified["text_settings"]["plain"]["position"],
+                    {**original, key: value},
+                )
+
+    def test_modify_settings_positions_tuple_conflicts(self):
+        """Test the positions tuple conflicts with every individual parameter."""
+        for param, value in (
+            ("vertical_position", [0.55, 0.65]),
+            ("horizontal_position", [0.3, 0.7]),
+            ("vertical_jitter", 0.04),
+            ("horizontal_jitter", 0.05),
+        ):
+            with self.subTest(param=param):
+                settings = json_clone(DEFAULT_SETTINGS)
+                result = self.settings.modify_settings(
+                    settings=settings,
+                    text_type="plain",
+                    positions=(None, None, None, 0.01),
+                    **{param: value},
+                )
+                self.assertEqual(result, settings)
+                self.assertIn(
+                    "Cannot mix positions tuple with individual position parameters",
+                    self.log_output.getvalue(),
+                )
+
     def test_modify_settings_margins_tuple(self):
         """Test margin modifications using tuple format."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Full margins tuple
         modified = self.settings.modify_settings(
@@ -651,7 +705,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_margins_individual(self):
         """Test margin modifications using individual parameters."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         modified = self.settings.modify_settings(
             settings=settings, text_type="plain", top_margin=0.15, right_margin=0.25
@@ -691,7 +745,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_position_validation(self):
         """Test position-specific validation."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Test invalid vertical position range (max < min)
         result = self.settings.modify_settings(
@@ -709,7 +763,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_margin_validation(self):
         """Test margin-specific validation."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Test margin/position overlap (vertical)
         result = self.settings.modify_settings(
@@ -752,7 +806,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_original_preserved(self):
         """Test that original settings are preserved on error."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
         original = copy.deepcopy(settings)
 
         # Try invalid modification
@@ -769,7 +823,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_highlight_type(self):
         """Test modifications specific to highlight text type."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Valid highlight modifications
         modified = self.settings.modify_settings(
@@ -828,7 +882,7 @@ class TestModifySettings(unittest.TestCase):
         sys.stdout = stdout
 
         try:
-            settings = copy.deepcopy(DEFAULT_SETTINGS)
+            settings = json_clone(DEFAULT_SETTINGS)
 
             # Test maximum reasonable values
             result = self.settings.modify_settings(
@@ -858,7 +912,7 @@ class TestModifySettings(unittest.TestCase):
         sys.stdout = stdout
 
         try:
-            settings = copy.deepcopy(DEFAULT_SETTINGS)
+            settings = json_clone(DEFAULT_SETTINGS)
 
             # Test multiple changes at once
             modified = self.settings.modify_settings(
@@ -911,7 +965,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_performance_edge_cases(self):
         """Test handling of performance edge cases."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Large number of unique colors
         large_colors = [
@@ -927,7 +981,7 @@ class TestModifySettings(unittest.TestCase):
         self.assertEqual(len(modified["text_settings"]["plain"]["colors"]), 1000)
 
         # Test deep nesting within valid structure
-        deep_settings = copy.deepcopy(DEFAULT_SETTINGS)
+        deep_settings = json_clone(DEFAULT_SETTINGS)
         current = deep_settings["text_settings"]["plain"]
         for i in range(10):  # Add nested text settings
             current["nested"] = copy.deepcopy(
@@ -942,7 +996,7 @@ class TestModifySettings(unittest.TestCase):
 
     def test_modify_settings_unicode_handling(self):
         """Test handling of unicode in settings."""
-        settings = copy.deepcopy(DEFAULT_SETTINGS)
+        settings = json_clone(DEFAULT_SETTINGS)
 
         # Mock font validation to pass
         original_validator = self.settings.settings_validator._validate_font
@@ -1104,7 +1158,7 @@ class TestApplySettings(unittest.TestCase):
         """Set up test environment."""
         self.settings = Settings()
         self.template = self.settings.load_template("default")
-        self.test_settings = copy.deepcopy(DEFAULT_SETTINGS)
+        self.test_settings = json_clone(DEFAULT_SETTINGS)
 
         # Setup logger capture
         self.log_output = StringIO()
@@ -1631,7 +1685,7 @@ class TestApplySettings(unittest.TestCase):
         self.settings.settings_validator.validate_settings.return_value = True
 
         # Use a deep copy of DEFAULT_SETTINGS
-        test_settings = copy.deepcopy(DEFAULT_SETTINGS)
+        test_settings = json_clone(DEFAULT_SETTINGS)
 
         targets = {"hook": ["product1", "product2"], "content": ["product1"]}
 
@@ -0,0 +1,55 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from interface.components.thumbnails import thumbnail_bytes
+
+
+class TestThumbnailBytes(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rgba_keeps_transparency(self):
+        """Transparent pixels stay transparent instead of showing the RGB data under them"""
+        path = self.dir / "overlay.png"
+        img = Image.new("RGBA", (400, 200), (0, 0, 0, 0))
+        img.paste((255, 0, 0, 255), (0, 0, 200, 200))
+        img.save(path)
+
+        with Image.open(io.BytesIO(thumbnail_bytes(path, max_side=100))) as thumb:
+            self.assertEqual(thumb.format, "PNG")
+            self.assertEqual(thumb.size, (100, 50))
+            thumb = thumb.convert("RGBA")
+            self.assertEqual(thumb.getpixel((90, 25))[3], 0)
+            self.assertEqual(thumb.getpixel((10, 25)), (255, 0, 0, 255))
+
+    def test_palette_transparency_keeps_alpha(self):
+        """P-mode images with a transparent index are treated like RGBA"""
+        path = self.dir / "overlay.gif"
+        img = Image.new("P", (50, 50), 0)
+        img.putpalette([0, 0, 0, 255, 255, 255] + [0] * 762)
+        img.save(path, transparency=0)
+
+        with Image.open(io.BytesIO(thumbnail_bytes(path))) as thumb:
+            self.assertEqual(thumb.format, "PNG")
+            self.assertEqual(thumb.convert("RGBA").getpixel((25, 25))[3], 0)
+
+    def test_opaque_encodes_jpeg(self):
+        """Opaque images are downscaled and encoded as JPEG"""
+        path = self.dir / "photo.png"
+        Image.new("RGB", (300, 600), (0, 128, 255)).save(path)
+
+        with Image.open(io.BytesIO(thumbnail_bytes(path, max_side=60))) as thumb:
+            self.assertEqual(thumb.format, "JPEG")
+            self.assertEqual(thumb.size, (30, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+from content_manager.metadata.metadata import Metadata
+from content_manager.metadata.metadata_editor import MetadataEditor
 from content_manager.settings.settings_constants import DEFAULT_TEMPLATE
 
 # Load default template once for all tests
@@ -15,4 +17,17 @@ from content_manager.settings.settings_constants import DEFAULT_TEMPLATE
 
 # Load default template once for all tests
 with open(DEFAULT_TEMPLATE) as f:
-    DEFAULT_SETTINGS = json.load(f)
\ No newline at end of file
+    DEFAULT_SETTINGS = json.load(f)
+
+
+def json_clone(data):
+    """Deep copy JSON-shaped fixture data, faster than copy.deepcopy"""
+    return json.loads(json.dumps(data))
+
+
+def metadata_with_data(data: dict, base_path: Path) -> Metadata:
+    """Build a Metadata handler around already loaded data, editor included"""
+    metadata = Metadata(base_path)
+    metadata.data = data
+    metadata.metadata_editor = MetadataEditor(data)
+    return metadata
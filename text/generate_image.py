@@ -1,8 +1,9 @@
 from PIL import Image
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from content_manager.settings.settings_constants import VALID_TEXT_TYPES
 from text.highlight_text import draw_highlight_image
 from text.plain_text import draw_plain_image  # We'll create this later
+from text.layer_pool import LayerPool
 import random
 from config.logging import logger
 
@@ -28,8 +29,11 @@ COLOR_PARAM_MAPPING = {
     }
 }
 
-def generate_image(settings: Dict[str, Any], text_type: str, colour_index: int, image_path: str, text: str) -> Image.Image:
-    """Calculate settings and apply text to image"""
+def generate_image(settings: Dict[str, Any], text_type: str, colour_index: int, image_path: str, text: str, layer_pool: Optional[LayerPool] = None) -> Image.Image:
+    """Calculate settings and apply text to image
+
+    Pass a layer_pool when rendering many slides to reuse text layer buffers.
+    """
     logger.debug(f"GENERATE // Text type: {text_type}")
     logger.debug(f"GENERATE // Settings for text type: {settings['text_settings'][text_type]}")
     
@@ -96,7 +100,8 @@ def generate_image(settings: Dict[str, Any], text_type: str, colour_index: int,
         "max_width": max_width,
         "width_center_position": width_center_position,
         "height_center_position": height_center_position,
-        "margins": calculated_margins
+        "margins": calculated_margins,
+        "layer_pool": layer_pool,
     }
     
     # Get colors for current index
@@ -1,4 +1,7 @@
 from PIL import Image, ImageDraw, ImageFont
+from typing import Optional
+
+from text.layer_pool import LayerPool, new_layer
 
 
 def draw_rounded_rectangle(draw, xy, radius, fill):
@@ -111,6 +114,7 @@ def draw_highlight_image(
     background_color: str,
     margins: dict,
     highlight_padding: int = 20,
+    layer_pool: Optional[LayerPool] = None,
 ) -> Image.Image:
     """Draw highlighted text on an existing image
     
@@ -128,12 +132,13 @@ def draw_highlight_image(
         height_center_position: Y position for text center (0-1)
         corner_radius: Radius for rounded corners
         highlight_padding: Padding around text
+        layer_pool: Optional pool to reuse the text layer buffer from
         
     Returns:
         PIL.Image: The image with text drawn on it
     """
     # Create a temporary transparent layer for the text
-    text_layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    text_layer = new_layer((width, height), layer_pool)
     draw = ImageDraw.Draw(text_layer)
     
     font = ImageFont.truetype(font_path, font_size)
@@ -158,6 +163,8 @@ def draw_highlight_image(
     )
     
     result = Image.alpha_composite(image.convert("RGBA"), text_layer)
+    if layer_pool is not None:
+        layer_pool.release(text_layer)
     return result
 
 
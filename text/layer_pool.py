@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from PIL import Image
+from typing import List, Optional, Tuple
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+class LayerPool:
+    """Recycles transparent RGBA text layers between slides.
+
+    Every slide draws its text onto a full-size RGBA layer. Slides from the
+    same content folder share dimensions, so layers are kept per size and
+    cleared on release instead of being reallocated for every slide.
+
+    Source photos come in any size, so at most max_sizes sizes are kept; the
+    least recently used size is evicted (and its layers closed) beyond that.
+
+    Not thread safe - acquire and release from the rendering thread only.
+    """
+
+    def __init__(self, max_per_size: int = 2, max_sizes: int = 4):
+        self.max_per_size = max_per_size
+        self.max_sizes = max_sizes
+        # size -> free layers, least recently used size first
+        self._free: "OrderedDict[Tuple[int, int], List[Image.Image]]" = OrderedDict()
+
+    def acquire(self, size: Tuple[int, int]) -> Image.Image:
+        """Get a cleared transparent RGBA layer of the given size"""
+        free = self._free.get(size)
+        if free:
+            self._free.move_to_end(size)
+            return free.pop()
+        return Image.new("RGBA", size, TRANSPARENT)
+
+    def release(self, layer: Image.Image) -> None:
+        """Clear a layer and keep it for reuse, or close it if the pool is full"""
+        free = self._free.get(layer.size)
+        if free is None:
+            free = self._free[layer.size] = []
+            while len(self._free) > self.max_sizes:
+                _, evicted = self._free.popitem(last=False)
+                for old in evicted:
+                    old.close()
+        else:
+            self._free.move_to_end(layer.size)
+        if len(free) >= self.max_per_size:
+            layer.close()
+            return
+        layer.paste(TRANSPARENT, (0, 0, *layer.size))
+        free.append(layer)
+
+    def clear(self) -> None:
+        """Close and drop every pooled layer"""
+        for free in self._free.values():
+            for layer in free:
+                layer.close()
+        self._free.clear()
+
+    def __len__(self) -> int:
+        """Number of pooled layers across all sizes"""
+        return sum(len(free) for free in self._free.values())
+
+
+def new_layer(size: Tuple[int, int], layer_pool: Optional[LayerPool]) -> Image.Image:
+    """Get a transparent RGBA layer, from the pool when one is given"""
+    if layer_pool is None:
+        return Image.new("RGBA", size, TRANSPARENT)
+    return layer_pool.acquire(size)
@@ -1,6 +1,9 @@
 from PIL import Image, ImageDraw, ImageFont
 import logging
 import random
+from typing import Optional
+
+from text.layer_pool import LayerPool, new_layer
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,7 @@ def draw_plain_image(
     text_color: str,
     outline_color: str,
     margins: dict,
+    layer_pool: Optional[LayerPool] = None,
 ) -> Image.Image:
     """Draw plain text with outline on an image
 
@@ -36,6 +40,7 @@ def draw_plain_image(
         text_color: Color of the main text
         outline_color: Color of the text outline
         highlight_padding: Ignored for plain text
+        layer_pool: Optional pool to reuse the text layer buffer from
 
     Returns:
         PIL.Image: The image with text drawn on it
@@ -63,7 +68,7 @@ def draw_plain_image(
     scaled_height = height * scale
     scaled_font_size = font_size * scale
 
-    text_layer = Image.new("RGBA", (scaled_width, scaled_height), (0, 0, 0, 0))
+    text_layer = new_layer((scaled_width, scaled_height), layer_pool)
     draw = ImageDraw.Draw(text_layer)
 
     # Load font at higher resolution
@@ -116,7 +121,10 @@ def draw_plain_image(
         )
 
     # Scale back down with high-quality resampling
+    scaled_layer = text_layer
     text_layer = text_layer.resize((width, height), Image.Resampling.LANCZOS)
+    if layer_pool is not None:
+        layer_pool.release(scaled_layer)
     result = Image.alpha_composite(base.resize((width, height), Image.Resampling.LANCZOS), text_layer)
 
     # Print final image metadata